@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 import asyncio
 import logging
 from .base import BaseCollector, CollectionResult
@@ -102,7 +102,7 @@ class DataCollector:
                         status="failed",
                         items_collected=0,
                         error_message=str(result),
-                        collected_at=datetime.utcnow(),
+                        collected_at=datetime.now(timezone.utc),
                     )
                 )
             elif isinstance(result, CollectionResult):
@@ -149,7 +149,7 @@ class DataCollector:
                     source_name=source_name,
                     success=True,
                     items_collected=items_count,
-                    collected_at=datetime.utcnow(),
+                    collected_at=datetime.now(timezone.utc),
                     data=data,
                 )
 
@@ -160,7 +160,7 @@ class DataCollector:
                 success=False,
                 items_collected=0,
                 error_message=str(e),
-                collected_at=datetime.utcnow(),
+                collected_at=datetime.now(timezone.utc),
             )
 
     def _count_items(self, source_name: str, data) -> int:
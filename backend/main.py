@@ -1,14 +1,25 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api import health, briefing
 from config import settings
+from mcp.clients import close_shared_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: close the shared MCP HTTP client on shutdown"""
+    yield
+    await close_shared_client()
+
 
 app = FastAPI(
     title="Port Assistant API",
     description="Product Marketing Productivity Assistant for Port.io",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware for Next.js frontend
@@ -1,3 +1,3 @@
-from .base_client import BaseMCPClient, MCPClientError
+from .base_client import BaseMCPClient, MCPClientError, MCPRateLimitError
 
-__all__ = ["BaseMCPClient", "MCPClientError"]
+__all__ = ["BaseMCPClient", "MCPClientError", "MCPRateLimitError"]
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, date
+import asyncio
+import functools
 import logging
+import random
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +16,87 @@ class MCPClientError(Exception):
     pass
 
 
+class MCPRateLimitError(MCPClientError):
+    """Raised when a data source rejects a request with HTTP 429"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Seconds the source asked us to wait (from Retry-After), if given
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Read a Retry-After header expressed in seconds"""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Status codes treated as transient by retry()
+RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+# Longest Retry-After retry() will wait out; beyond this (e.g. a daily quota
+# reset) the error is raised so callers can fall back instead of stalling
+MAX_RETRY_DELAY = 30.0
+
+
+def retry(
+    max_attempts: int = 4,
+    base_delay: float = 0.5,
+    jitter: bool = True,
+    retry_on: Tuple[int, ...] = RETRY_STATUS_CODES,
+    max_delay: float = MAX_RETRY_DELAY,
+):
+    """
+    Retry an async HTTP call on transient status codes with exponential backoff
+
+    Waits base_delay * 2**attempt (plus up to 100ms of jitter) between attempts,
+    or the source's Retry-After value when one is given.
+
+    Args:
+        max_attempts: Total number of attempts, including the first
+        base_delay: Initial backoff in seconds
+        jitter: Add random jitter to avoid synchronized retries
+        retry_on: HTTP status codes that trigger a retry
+        max_delay: Give up immediately if the source asks us to wait longer than this
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except MCPRateLimitError as e:
+                    if 429 not in retry_on or attempt == max_attempts - 1:
+                        raise
+                    error, status, delay = e, 429, e.retry_after
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if status not in retry_on or attempt == max_attempts - 1:
+                        raise
+                    error, delay = e, _parse_retry_after(e.response)
+
+                if delay is not None and delay > max_delay:
+                    raise error
+                if delay is None:
+                    delay = base_delay * 2 ** attempt + (random.random() * 0.1 if jitter else 0.0)
+                logger.warning(
+                    f"{func.__qualname__} got HTTP {status}, retrying in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{max_attempts})"
+                )
+                await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
 class BaseMCPClient(ABC):
     """
     Base class for all MCP (Model Context Protocol) clients.
@@ -78,6 +164,47 @@ class BaseMCPClient(ABC):
         """
         pass
 
+    @retry()
+    async def _get_json(self, url: str, **kwargs) -> Any:
+        """
+        GET a URL and decode its JSON body, retrying transient failures
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to httpx (params, headers, ...)
+
+        Raises:
+            MCPRateLimitError: If the source still responds with HTTP 429 after retries
+            httpx.HTTPStatusError: For any other non-2xx response
+        """
+        response = await self.http_client.get(url, **kwargs)
+        return self._decode_json(response)
+
+    @retry()
+    async def _post_json(self, url: str, **kwargs) -> Any:
+        """POST to a URL and decode its JSON body (see _get_json)"""
+        response = await self.http_client.post(url, **kwargs)
+        return self._decode_json(response)
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """Raise MCPRateLimitError on HTTP 429, or httpx.HTTPStatusError on other failures"""
+        if response.status_code == 429:
+            raise MCPRateLimitError(
+                f"Rate limited by {self.get_source_name()}",
+                retry_after=_parse_retry_after(response),
+            )
+        response.raise_for_status()
+
+    def _decode_json(self, response: httpx.Response) -> Any:
+        """Check response status and content type, then decode JSON"""
+        self._raise_for_status(response)
+
+        content_type = response.headers.get("content-type", "")
+        if "json" not in content_type:
+            raise MCPClientError(f"Expected JSON from {response.url}, got '{content_type}'")
+
+        return orjson.loads(response.content)
+
     def get_source_name(self) -> str:
         """Get the name of this data source"""
         return self.__class__.__name__.replace("MCPClient", "").lower()
@@ -6,6 +6,7 @@ from .notion_client import NotionMCPClient
 from .miro_client import MiroMCPClient
 from .weather_client import WeatherMCPClient
 from .news_client import NewsMCPClient
+from ._http import get_shared_client, close_shared_client
 
 __all__ = [
     "GoogleMCPClient",
@@ -16,4 +17,6 @@ __all__ = [
     "MiroMCPClient",
     "WeatherMCPClient",
     "NewsMCPClient",
+    "get_shared_client",
+    "close_shared_client",
 ]
@@ -0,0 +1,177 @@
+"""
+In-process TTL cache for read-mostly MCP list endpoints.
+
+Responses are stored as decoded JSON keyed on the request (method, URL, query,
+body and headers), so refreshes within the TTL skip the network entirely.
+Expired GET entries are kept along with their ETag/Last-Modified validators and
+revalidated with a conditional request; a 304 extends the TTL without
+re-downloading or re-decoding the body. Transient failures are retried, and if
+a source is still rate limiting, the last known-good response is served.
+Cached values are shared between callers and must be treated as read-only.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+import hashlib
+import json
+import logging
+import time
+import httpx
+import orjson
+from ..base_client import MCPRateLimitError, _parse_retry_after, retry
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of cached responses kept in memory
+MAX_ENTRIES = 256
+
+# Cache key -> (expires_at, decoded JSON, conditional request headers)
+_cache: Dict[str, Tuple[float, Any, Dict[str, str]]] = {}
+
+_MISS = object()
+
+
+def _cache_key(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    body: Any = None,
+) -> str:
+    """Hash the request into a fixed-size key (keeps tokens out of the cache keys)"""
+    parts = [method, url]
+    if params:
+        parts.append(urlencode(sorted(params.items())))
+    if headers:
+        parts.append(urlencode(sorted(headers.items())))
+    if body is not None:
+        parts.append(json.dumps(body, sort_keys=True))
+    return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _lookup(key: str) -> Any:
+    """Return the cached value for key, or _MISS if absent or expired"""
+    entry = _cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return _MISS
+    return entry[1]
+
+
+def _validators(response: httpx.Response) -> Dict[str, str]:
+    """Build conditional request headers from a response's ETag/Last-Modified"""
+    validators = {}
+    etag = response.headers.get("etag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = response.headers.get("last-modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+def _store(
+    key: str,
+    data: Any,
+    ttl: float,
+    validators: Optional[Dict[str, str]] = None,
+) -> None:
+    """Store a value, evicting the entry closest to expiry when full"""
+    if key not in _cache and len(_cache) >= MAX_ENTRIES:
+        del _cache[min(_cache, key=lambda k: _cache[k][0])]
+    _cache[key] = (time.monotonic() + ttl, data, validators or {})
+
+
+@retry()
+async def _send(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request, raising on failures (304 is passed through for revalidation)"""
+    response = await client.request(method, url, **kwargs)
+    if response.status_code == 429:
+        raise MCPRateLimitError(
+            f"Rate limited by {response.url.host}",
+            retry_after=_parse_retry_after(response),
+        )
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def _serve_stale(stale: Optional[Tuple[float, Any, Dict[str, str]]], url: str, error: Exception) -> Any:
+    """Return the last known-good value for a rate-limited request, or re-raise"""
+    if stale is None:
+        raise error
+    logger.warning(f"Rate limited fetching {url}, serving cached response")
+    return stale[1]
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    ttl: float = 300.0,
+) -> Any:
+    """
+    GET a JSON endpoint, serving from cache while the entry is fresh and
+    revalidating expired entries with If-None-Match/If-Modified-Since
+
+    Raises:
+        MCPRateLimitError: If still rate limited after retries and nothing is cached
+        httpx.HTTPStatusError: If the request is made and fails
+    """
+    key = _cache_key("GET", url, params, headers)
+    data = _lookup(key)
+    if data is not _MISS:
+        return data
+
+    stale = _cache.get(key)
+    request_headers = dict(headers or {})
+    if stale and stale[2]:
+        request_headers.update(stale[2])
+
+    try:
+        response = await _send(client, "GET", url, params=params, headers=request_headers)
+    except MCPRateLimitError as e:
+        return _serve_stale(stale, url, e)
+    if response.status_code == 304 and stale:
+        _store(key, stale[1], ttl, stale[2])
+        return stale[1]
+
+    data = orjson.loads(response.content)
+    _store(key, data, ttl, _validators(response))
+    return data
+
+
+async def cached_post(
+    client: httpx.AsyncClient,
+    url: str,
+    json_body: Any,
+    headers: Optional[Dict[str, str]] = None,
+    ttl: float = 300.0,
+    cacheable: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """
+    POST a JSON query (e.g. GraphQL), serving from cache while the entry is fresh
+
+    Args:
+        cacheable: Optional predicate on the decoded body; responses failing it
+            (e.g. GraphQL error payloads) are returned but not cached
+
+    Raises:
+        MCPRateLimitError: If still rate limited after retries and nothing is cached
+        httpx.HTTPStatusError: If the request is made and fails
+    """
+    key = _cache_key("POST", url, headers=headers, body=json_body)
+    data = _lookup(key)
+    if data is not _MISS:
+        return data
+
+    request_headers = {"Content-Type": "application/json", **(headers or {})}
+    try:
+        response = await _send(
+            client, "POST", url, content=orjson.dumps(json_body), headers=request_headers
+        )
+    except MCPRateLimitError as e:
+        return _serve_stale(_cache.get(key), url, e)
+    data = orjson.loads(response.content)
+    if cacheable is None or cacheable(data):
+        _store(key, data, ttl)
+    return data
@@ -0,0 +1,43 @@
+"""
+Process-wide httpx.AsyncClient shared by the MCP clients.
+
+Clients pass their own auth headers per request, so a single connection pool
+(and one TLS session per host) serves every data source instead of each client
+opening and tearing down its own.
+"""
+from typing import Optional
+import httpx
+
+# Connection pool sizing for MCP HTTP clients
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # HTTP/2 lets parallel requests to one host (e.g. the three NewsAPI
+        # queries) multiplex over a single connection. The transport retries
+        # failed connection attempts; HTTP-level retries are handled by
+        # base_client.retry()
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=POOL_LIMITS,
+        )
+        _shared_client = httpx.AsyncClient(transport=transport, timeout=30.0)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client (called on application shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,32 @@
+"""
+Timestamp helpers shared by the MCP clients.
+
+parse_iso uses ciso8601's C parser when it is installed and otherwise falls
+back to datetime.fromisoformat (normalising a trailing "Z" for Pythons older
+than 3.11). now_iso formats the current UTC time for status payloads.
+"""
+from datetime import datetime, timezone
+from typing import Tuple
+import time
+
+try:
+    from ciso8601 import parse_datetime as parse_iso
+except ImportError:
+    def parse_iso(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp, accepting a trailing "Z" for UTC"""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
+# (epoch second, ISO string) of the last now_iso() call
+_now_cache: Tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, memoized to one-second resolution"""
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).isoformat())
+    return _now_cache[1]
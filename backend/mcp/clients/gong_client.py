@@ -1,9 +1,16 @@
 from typing import Any, Dict, List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+import time
 import httpx
 from ..base_client import BaseMCPClient, MCPClientError
+from ._http import get_shared_client
 from models.data_sources import GongData
 
+UTC = timezone.utc
+
+# How long a test_connection result is reused before probing again
+PROBE_TTL_SECONDS = 30.0
+
 
 class GongMCPClient(BaseMCPClient):
     """MCP Client for Gong.io"""
@@ -13,29 +20,24 @@ class GongMCPClient(BaseMCPClient):
         self.access_key = config.get("GONG_ACCESS_KEY")
         self.access_key_secret = config.get("GONG_ACCESS_KEY_SECRET")
         self.base_url = config.get("GONG_BASE_URL", "https://api.gong.io/v2")
+        # Gong uses Basic Auth with access key and secret
+        self.auth = httpx.BasicAuth(self.access_key or "", self.access_key_secret or "")
         self.http_client: Optional[httpx.AsyncClient] = None
+        self._last_probe_ts: float = 0.0
+        self._last_probe_result: Optional[Dict[str, Any]] = None
 
     async def connect(self) -> bool:
         """Establish connection to Gong"""
         try:
-            # Gong uses Basic Auth with access key and secret
-            self.http_client = httpx.AsyncClient(
-                timeout=30.0,
-                auth=(self.access_key, self.access_key_secret),
-                headers={
-                    "Content-Type": "application/json"
-                }
-            )
+            self.http_client = get_shared_client()
             self.logger.info("Gong MCP client connected successfully")
             return True
         except Exception as e:
             raise MCPClientError(f"Failed to connect to Gong: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -82,15 +84,21 @@ class GongMCPClient(BaseMCPClient):
                 }
             }
 
-            response = await self.http_client.post(url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
+            # Results are paged; parse each page before requesting the next so only
+            # one raw page of call content is held in memory at a time
             calls = []
-            for call_item in data.get("calls", []):
-                call_data = await self._parse_extensive_call(call_item)
-                if call_data:
-                    calls.append(call_data)
+            while True:
+                data = await self._post_json(url, json=payload, auth=self.auth)
+
+                for call_item in data.get("calls", []):
+                    call_data = await self._parse_extensive_call(call_item)
+                    if call_data:
+                        calls.append(call_data)
+
+                cursor = data.get("records", {}).get("cursor")
+                if not cursor:
+                    break
+                payload["cursor"] = cursor
 
             self.logger.info(f"Fetched {len(calls)} Gong calls with AI content")
             return calls
@@ -110,20 +118,20 @@ class GongMCPClient(BaseMCPClient):
 
             # Parse started time
             started = metadata.get("started")
-            call_date = datetime.fromisoformat(started.replace("Z", "+00:00")) if started else datetime.utcnow()
+            call_date = datetime.fromisoformat(started.replace("Z", "+00:00")) if started else datetime.now(UTC)
 
             # Extract participants from parties
-            participants = []
-            customer_name = None
-
-            for party in parties:
-                name = party.get("name", "")
-                if name:
-                    participants.append(name)
-                    # Try to identify customer (external party)
-                    if party.get("context") == "External" or party.get("affiliation") != "Internal":
-                        if not customer_name:
-                            customer_name = name
+            participants = [name for party in parties if (name := party.get("name"))]
+
+            # Try to identify customer (first external party)
+            customer_name = next(
+                (
+                    party["name"] for party in parties
+                    if party.get("name")
+                    and (party.get("context") == "External" or party.get("affiliation") != "Internal")
+                ),
+                None,
+            )
 
             # Extract AI content
             brief = content.get("brief", "")
@@ -153,11 +161,11 @@ class GongMCPClient(BaseMCPClient):
                     elif isinstance(highlight, str):
                         highlight_texts.append(highlight)
 
-            return GongData(
+            return GongData.fast(
                 call_id=call_id,
                 title=metadata.get("title", ""),
                 date=call_date,
-                duration_minutes=metadata.get("duration", 0) // 60,
+                duration_minutes=int(metadata.get("duration") or 0) // 60,
                 participants=participants,
                 customer_name=customer_name,
                 summary=brief,  # AI-generated brief
@@ -170,20 +178,30 @@ class GongMCPClient(BaseMCPClient):
             return None
 
     async def test_connection(self) -> Dict[str, Any]:
-        """Test connection to Gong"""
+        """Test connection to Gong (result cached for PROBE_TTL_SECONDS)"""
+        now = time.monotonic()
+        if self._last_probe_result is not None and now - self._last_probe_ts < PROBE_TTL_SECONDS:
+            return self._last_probe_result
+
+        self._last_probe_result = await self._probe_connection()
+        self._last_probe_ts = now
+        return self._last_probe_result
+
+    async def _probe_connection(self) -> Dict[str, Any]:
+        """Fetch users as a simple connectivity check"""
         try:
             # Try to fetch users as a simple test
             url = f"{self.base_url}/users"
-            response = await self.http_client.get(url)
+            response = await self.http_client.get(url, auth=self.auth)
 
             return {
                 "connected": response.status_code == 200,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             }
@@ -1,9 +1,24 @@
 from typing import Any, Dict, List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import asyncio
+import base64
+import re
+import time
 import httpx
 from ..base_client import BaseMCPClient, MCPClientError
+from ._http import get_shared_client
 from models.data_sources import EmailData, CalendarEvent
 
+UTC = timezone.utc
+
+# How long a test_connection result is reused before probing again
+PROBE_TTL_SECONDS = 30.0
+
+# Address parsing patterns for 'Name <email@domain.com>' headers
+_EMAIL_RE = re.compile(r'<([^>]+)>')
+_NAME_RE = re.compile(r'^([^<]+)<')
+
 
 class GoogleMCPClient(BaseMCPClient):
     """
@@ -19,11 +34,14 @@ class GoogleMCPClient(BaseMCPClient):
         self.access_token: Optional[str] = None
         self.token_expiry: Optional[datetime] = None
         self.http_client: Optional[httpx.AsyncClient] = None
+        self._refresh_lock = asyncio.Lock()
+        self._last_probe_ts: float = 0.0
+        self._last_probe_result: Optional[Dict[str, Any]] = None
 
     async def connect(self) -> bool:
         """Establish connection and get access token"""
         try:
-            self.http_client = httpx.AsyncClient(timeout=30.0)
+            self.http_client = get_shared_client()
             await self._refresh_access_token()
             self.logger.info("Google MCP client connected successfully")
             return True
@@ -31,10 +49,8 @@ class GoogleMCPClient(BaseMCPClient):
             raise MCPClientError(f"Failed to connect to Google: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def _refresh_access_token(self) -> None:
         """Refresh OAuth access token"""
@@ -46,21 +62,29 @@ class GoogleMCPClient(BaseMCPClient):
             "grant_type": "refresh_token",
         }
 
-        response = await self.http_client.post(token_url, data=data)
-        if response.status_code != 200:
-            raise MCPClientError(f"Failed to refresh token: {response.text}")
-
-        token_data = response.json()
+        try:
+            token_data = await self._post_json(token_url, data=data)
+        except httpx.HTTPStatusError as e:
+            raise MCPClientError(f"Failed to refresh token: {e.response.text}")
         self.access_token = token_data["access_token"]
         expires_in = token_data.get("expires_in", 3600)
-        self.token_expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+        self.token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
+
+    def _token_is_valid(self) -> bool:
+        """Check whether the access token exists and is not about to expire"""
+        return bool(self.access_token) and not (
+            self.token_expiry and datetime.now(UTC) >= self.token_expiry - timedelta(minutes=5)
+        )
 
     async def _ensure_token_valid(self) -> None:
         """Ensure access token is valid, refresh if needed"""
-        if not self.access_token or (
-            self.token_expiry and datetime.utcnow() >= self.token_expiry - timedelta(minutes=5)
-        ):
-            await self._refresh_access_token()
+        if self._token_is_valid():
+            return
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self._token_is_valid():
+                await self._refresh_access_token()
 
     async def fetch_data(
         self,
@@ -106,9 +130,7 @@ class GoogleMCPClient(BaseMCPClient):
         params = {"q": query, "maxResults": max_results}
 
         try:
-            response = await self.http_client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(url, headers=headers, params=params)
 
             emails = []
             for msg in data.get("messages", []):
@@ -129,9 +151,7 @@ class GoogleMCPClient(BaseMCPClient):
             url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}"
             params = {"format": "full"}
 
-            response = await self.http_client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            msg = response.json()
+            msg = await self._get_json(url, headers=headers, params=params)
 
             # Parse headers
             headers_dict = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
@@ -143,7 +163,9 @@ class GoogleMCPClient(BaseMCPClient):
             date_str = headers_dict.get("Date", "")
             email_date = self._parse_email_date(date_str)
 
-            return EmailData(
+            label_ids = msg.get("labelIds", [])
+
+            return EmailData.fast(
                 id=message_id,
                 thread_id=msg.get("threadId", ""),
                 subject=headers_dict.get("Subject", ""),
@@ -153,8 +175,8 @@ class GoogleMCPClient(BaseMCPClient):
                 cc_emails=self._parse_email_list(headers_dict.get("Cc", "")),
                 date=email_date,
                 body=body,
-                labels=msg.get("labelIds", []),
-                is_important="IMPORTANT" in msg.get("labelIds", []),
+                labels=label_ids,
+                is_important="IMPORTANT" in label_ids,
                 snippet=msg.get("snippet", ""),
             )
 
@@ -165,36 +187,31 @@ class GoogleMCPClient(BaseMCPClient):
     def _extract_email_body(self, payload: Dict[str, Any]) -> str:
         """Extract email body from message payload"""
         if "body" in payload and payload["body"].get("data"):
-            import base64
             return base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8", errors="ignore")
 
         if "parts" in payload:
             for part in payload["parts"]:
                 if part.get("mimeType") == "text/plain":
                     if part.get("body", {}).get("data"):
-                        import base64
                         return base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8", errors="ignore")
 
         return ""
 
     def _parse_email_date(self, date_str: str) -> datetime:
         """Parse email date string"""
-        from email.utils import parsedate_to_datetime
         try:
             return parsedate_to_datetime(date_str)
         except:
-            return datetime.utcnow()
+            return datetime.now(UTC)
 
     def _extract_email(self, email_string: str) -> str:
         """Extract email address from 'Name <email@domain.com>' format"""
-        import re
-        match = re.search(r'<([^>]+)>', email_string)
+        match = _EMAIL_RE.search(email_string)
         return match.group(1) if match else email_string
 
     def _extract_name(self, email_string: str) -> Optional[str]:
         """Extract name from 'Name <email@domain.com>' format"""
-        import re
-        match = re.match(r'^([^<]+)<', email_string)
+        match = _NAME_RE.match(email_string)
         return match.group(1).strip() if match else None
 
     def _parse_email_list(self, email_string: str) -> List[str]:
@@ -227,9 +244,7 @@ class GoogleMCPClient(BaseMCPClient):
         }
 
         try:
-            response = await self.http_client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(url, headers=headers, params=params)
 
             events = []
             for item in data.get("items", []):
@@ -263,7 +278,7 @@ class GoogleMCPClient(BaseMCPClient):
             attendees = [a.get("email", "") for a in item.get("attendees", [])]
             organizer = item.get("organizer", {}).get("email")
 
-            return CalendarEvent(
+            return CalendarEvent.fast(
                 id=item.get("id", ""),
                 summary=item.get("summary", "No Title"),
                 description=item.get("description"),
@@ -280,7 +295,17 @@ class GoogleMCPClient(BaseMCPClient):
             return None
 
     async def test_connection(self) -> Dict[str, Any]:
-        """Test connection to Google APIs"""
+        """Test connection to Google APIs (result cached for PROBE_TTL_SECONDS)"""
+        now = time.monotonic()
+        if self._last_probe_result is not None and now - self._last_probe_ts < PROBE_TTL_SECONDS:
+            return self._last_probe_result
+
+        self._last_probe_result = await self._probe_connection()
+        self._last_probe_ts = now
+        return self._last_probe_result
+
+    async def _probe_connection(self) -> Dict[str, Any]:
+        """Probe Gmail and Calendar with the current token"""
         try:
             await self._ensure_token_valid()
 
@@ -300,12 +325,12 @@ class GoogleMCPClient(BaseMCPClient):
                 "connected": gmail_ok and cal_ok,
                 "gmail": gmail_ok,
                 "calendar": cal_ok,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             }
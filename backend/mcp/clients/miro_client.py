@@ -1,9 +1,20 @@
 from typing import Any, Dict, List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
+import asyncio
 import httpx
-from ..base_client import BaseMCPClient, MCPClientError
+import orjson
+from ..base_client import BaseMCPClient, MCPClientError, MCPRateLimitError, retry
+from ._cache import cached_get
+from ._http import get_shared_client
+from ._time import now_iso, parse_iso
 from models.data_sources import MiroData
 
+# Seconds to reuse the boards listing between refreshes
+BOARDS_CACHE_TTL = 600.0
+
+# Maximum number of boards whose stats are requested at once
+MAX_CONCURRENT_BOARDS = 8
+
 
 class MiroMCPClient(BaseMCPClient):
     """MCP Client for Miro"""
@@ -12,28 +23,21 @@ class MiroMCPClient(BaseMCPClient):
         super().__init__(config)
         self.access_token = config.get("MIRO_ACCESS_TOKEN")
         self.api_url = "https://api.miro.com/v2"
+        self.headers = {"Authorization": f"Bearer {self.access_token}"}
         self.http_client: Optional[httpx.AsyncClient] = None
 
     async def connect(self) -> bool:
         """Establish connection to Miro"""
         try:
-            self.http_client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json"
-                }
-            )
+            self.http_client = get_shared_client()
             self.logger.info("Miro MCP client connected successfully")
             return True
         except Exception as e:
             raise MCPClientError(f"Failed to connect to Miro: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -55,16 +59,27 @@ class MiroMCPClient(BaseMCPClient):
             # Get all boards
             boards = await self._get_boards()
 
-            # Filter by modification date
-            filtered_boards = []
-            for board in boards:
-                modified_at = board.get("modifiedAt")
-                if modified_at:
-                    modified_dt = datetime.fromisoformat(modified_at.replace("Z", "+00:00"))
-                    if start_date <= modified_dt.date() <= end_date:
-                        miro_board = await self._parse_board(board)
-                        if miro_board:
-                            filtered_boards.append(miro_board)
+            # Filter by modification date. Miro returns UTC ISO-8601 timestamps,
+            # so comparing the YYYY-MM-DD prefix as a string matches the date range
+            start_iso = start_date.isoformat()
+            end_iso = end_date.isoformat()
+            candidates = [
+                board for board in boards
+                if start_iso <= (board.get("modifiedAt") or "")[:10] <= end_iso
+            ]
+
+            # Each board needs its own stats requests; run them concurrently
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BOARDS)
+
+            async def parse_one(board: Dict[str, Any]) -> Optional[MiroData]:
+                async with semaphore:
+                    return await self._parse_board(board)
+
+            parsed = await asyncio.gather(
+                *(parse_one(board) for board in candidates),
+                return_exceptions=True
+            )
+            filtered_boards = [board for board in parsed if isinstance(board, MiroData)]
 
             self.logger.info(f"Fetched {len(filtered_boards)} Miro boards")
             return filtered_boards
@@ -77,9 +92,9 @@ class MiroMCPClient(BaseMCPClient):
         """Get all accessible boards"""
         try:
             url = f"{self.api_url}/boards"
-            response = await self.http_client.get(url)
-            response.raise_for_status()
-            data = response.json()
+            data = await cached_get(
+                self.http_client, url, headers=self.headers, ttl=BOARDS_CACHE_TTL
+            )
 
             return data.get("data", [])
 
@@ -93,12 +108,8 @@ class MiroMCPClient(BaseMCPClient):
             board_id = board.get("id", "")
 
             # Parse timestamps
-            created_at = datetime.fromisoformat(
-                board.get("createdAt", "").replace("Z", "+00:00")
-            )
-            modified_at = datetime.fromisoformat(
-                board.get("modifiedAt", "").replace("Z", "+00:00")
-            )
+            created_at = parse_iso(board.get("createdAt", ""))
+            modified_at = parse_iso(board.get("modifiedAt", ""))
 
             # Get owner info
             owner_info = board.get("owner", {})
@@ -107,7 +118,7 @@ class MiroMCPClient(BaseMCPClient):
             # Get board statistics
             stats = await self._get_board_stats(board_id)
 
-            return MiroData(
+            return MiroData.fast(
                 board_id=board_id,
                 board_name=board.get("name", "Untitled Board"),
                 description=board.get("description"),
@@ -126,51 +137,55 @@ class MiroMCPClient(BaseMCPClient):
 
     async def _get_board_stats(self, board_id: str) -> Dict[str, int]:
         """Get statistics for a board (item count, frame count)"""
+        items_url = f"{self.api_url}/boards/{board_id}/items"
         try:
-            # Get items
-            items_url = f"{self.api_url}/boards/{board_id}/items"
-            items_response = await self.http_client.get(items_url, params={"limit": 1})
+            item_count = await self._count(items_url, {"limit": 1})
 
-            item_count = 0
-            if items_response.status_code == 200:
-                items_data = items_response.json()
-                item_count = items_data.get("total", 0)
+            # An empty board has no frames either; skip the second request
+            if item_count == 0:
+                return {"item_count": 0, "frame_count": 0}
 
             # Count frames (a type of item in Miro)
-            frames_url = f"{self.api_url}/boards/{board_id}/items"
-            frames_response = await self.http_client.get(
-                frames_url,
-                params={"type": "frame", "limit": 1}
-            )
-
-            frame_count = 0
-            if frames_response.status_code == 200:
-                frames_data = frames_response.json()
-                frame_count = frames_data.get("total", 0)
+            frame_count = await self._count(items_url, {"type": "frame", "limit": 1})
 
             return {
-                "item_count": item_count,
-                "frame_count": frame_count,
+                "item_count": item_count or 0,
+                "frame_count": frame_count or 0,
             }
 
         except Exception as e:
             self.logger.warning(f"Failed to get board stats: {str(e)}")
             return {"item_count": 0, "frame_count": 0}
 
+    async def _count(self, url: str, params: Dict[str, Any]) -> Optional[int]:
+        """Total for one list request, or None if Miro answered with an error status"""
+        try:
+            return await self._get_total(url, params)
+        except (httpx.HTTPStatusError, MCPRateLimitError) as e:
+            self.logger.warning(f"Failed to count board items: {str(e)}")
+            return None
+
+    @retry()
+    async def _get_total(self, url: str, params: Dict[str, Any]) -> int:
+        """Read the "total" pagination field of a Miro list endpoint"""
+        response = await self.http_client.get(url, headers=self.headers, params=params)
+        self._raise_for_status(response)
+        return orjson.loads(response.content).get("total", 0)
+
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to Miro"""
         try:
             url = f"{self.api_url}/boards"
-            response = await self.http_client.get(url, params={"limit": 1})
+            response = await self.http_client.get(url, headers=self.headers, params={"limit": 1})
 
             return {
                 "connected": response.status_code == 200,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
@@ -1,39 +1,122 @@
-from typing import Any, Dict, List, Optional
-from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+from datetime import date, timedelta
+import asyncio
 import httpx
-from ..base_client import BaseMCPClient, MCPClientError
+import orjson
+from ..base_client import BaseMCPClient, MCPClientError, retry
+from ._cache import cached_post
+from ._http import get_shared_client
+from ._time import now_iso, parse_iso
 from models.data_sources import MondayData
 
+# Boards fetched per GraphQL request (Monday returns at most 25 boards per query)
+BOARDS_PER_REQUEST = 25
+
+# Items requested per items_page / next_items_page call (Monday allows up to 500)
+ITEMS_PAGE_LIMIT = 100
+
+# Most recent updates kept per item
+MAX_ITEM_UPDATES = 5
+
+# Maximum number of GraphQL requests in flight at once
+MAX_CONCURRENT_REQUESTS = 10
+
+# Seconds to reuse the account's board ID list
+BOARD_IDS_CACHE_TTL = 600.0
+
+BOARD_IDS_QUERY = """
+query {
+    boards {
+        id
+    }
+}
+"""
+
+# Only the fields _parse_item reads; column "value" JSON and older updates are
+# the bulk of a large board's payload, so they are left out server-side
+ITEM_FIELDS_FRAGMENT = """
+fragment ItemFields on Item {
+    id
+    name
+    created_at
+    updated_at
+    column_values {
+        id
+        text
+    }
+    updates(limit: %d) {
+        id
+        body
+        created_at
+    }
+}
+""" % MAX_ITEM_UPDATES
+
+# Newest-updated first, so pagination can stop at the first page that
+# reaches back past start_date
+BOARD_ITEMS_QUERY = """
+query ($boardIds: [ID!]!) {
+    boards(ids: $boardIds) {
+        id
+        name
+        items_page(
+            limit: %d,
+            query_params: {order_by: [{column_id: "__last_updated__", direction: desc}]}
+        ) {
+            cursor
+            items {
+                ...ItemFields
+            }
+        }
+    }
+}
+""" % ITEMS_PAGE_LIMIT + ITEM_FIELDS_FRAGMENT
+
+NEXT_ITEMS_PAGE_QUERY = """
+query ($cursor: String!) {
+    next_items_page(limit: %d, cursor: $cursor) {
+        cursor
+        items {
+            ...ItemFields
+        }
+    }
+}
+""" % ITEMS_PAGE_LIMIT + ITEM_FIELDS_FRAGMENT
+
+ME_QUERY = "query { me { name } }"
+
 
 class MondayMCPClient(BaseMCPClient):
     """MCP Client for Monday.com"""
 
+    # Column ID -> MondayData field for columns copied through as text
+    _COL_HANDLERS = {"status": "status", "person": "owner", "priority": "priority"}
+
+    # Column IDs holding the item's due date
+    _DATE_COLS = frozenset({"date", "due_date"})
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_key = config.get("MONDAY_API_KEY")
         self.api_url = "https://api.monday.com/v2"
+        self.headers = {
+            "Authorization": self.api_key,
+            "Content-Type": "application/json",
+        }
         self.http_client: Optional[httpx.AsyncClient] = None
 
     async def connect(self) -> bool:
         """Establish connection to Monday.com"""
         try:
-            self.http_client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "Authorization": self.api_key,
-                    "Content-Type": "application/json"
-                }
-            )
+            self.http_client = get_shared_client()
             self.logger.info("Monday MCP client connected successfully")
             return True
         except Exception as e:
             raise MCPClientError(f"Failed to connect to Monday: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -50,18 +133,10 @@ class MondayMCPClient(BaseMCPClient):
             end_date: End date (defaults to start_date)
             board_ids: List of board IDs to fetch from (None = all boards)
         """
-        if end_date is None:
-            end_date = start_date
-
         try:
-            # If no board IDs specified, get all boards
-            if board_ids is None:
-                board_ids = await self._get_board_ids()
-
-            items = []
-            for board_id in board_ids:
-                board_items = await self._fetch_board_items(board_id, start_date, end_date)
-                items.extend(board_items)
+            items = [
+                item async for item in self.iter_items(start_date, end_date, board_ids)
+            ]
 
             self.logger.info(f"Fetched {len(items)} Monday.com items")
             return items
@@ -70,22 +145,82 @@ class MondayMCPClient(BaseMCPClient):
             self.logger.error(f"Error fetching Monday items: {str(e)}")
             raise MCPClientError(f"Failed to fetch Monday items: {str(e)}")
 
-    async def _get_board_ids(self) -> List[int]:
-        """Get list of all board IDs"""
-        query = """
-        query {
-            boards {
-                id
-            }
-        }
+    async def iter_items(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        board_ids: Optional[List[int]] = None,
+    ) -> AsyncIterator[MondayData]:
+        """
+        Yield Monday.com items from specified date range as each batch of boards arrives
+
+        Args:
+            start_date: Start date for items
+            end_date: End date (defaults to start_date)
+            board_ids: List of board IDs to fetch from (None = all boards)
         """
+        if end_date is None:
+            end_date = start_date
+
+        # If no board IDs specified, get all boards
+        if board_ids is None:
+            board_ids = await self._get_board_ids()
+
+        # Batch boards into one query per chunk, and run chunks concurrently
+        # (bounded so large accounts don't burst the API)
+        chunks = [
+            board_ids[i:i + BOARDS_PER_REQUEST]
+            for i in range(0, len(board_ids), BOARDS_PER_REQUEST)
+        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_chunk(chunk: List[int]) -> List[MondayData]:
+            async with semaphore:
+                try:
+                    return await self._fetch_board_items(chunk, start_date, end_date)
+                except Exception as e:
+                    self.logger.warning(f"Failed to fetch boards {chunk}: {str(e)}")
+                    return []
+
+        tasks = [asyncio.ensure_future(fetch_chunk(chunk)) for chunk in chunks]
+        try:
+            for next_chunk in asyncio.as_completed(tasks):
+                for item in await next_chunk:
+                    yield item
+        finally:
+            # Stop outstanding requests if the caller stops iterating early
+            for task in tasks:
+                task.cancel()
+
+    @retry()
+    async def _graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """POST a GraphQL query, encoding the body with orjson and retrying transient failures"""
+        payload: Dict[str, Any] = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+        response = await self.http_client.post(
+            self.api_url,
+            headers=self.headers,
+            content=orjson.dumps(payload)
+        )
+        self._raise_for_status(response)
+        return orjson.loads(response.content)
 
+    async def _get_board_ids(self) -> List[int]:
+        """Get list of all board IDs"""
         try:
-            response = await self.http_client.post(
+            data = await cached_post(
+                self.http_client,
                 self.api_url,
-                json={"query": query}
+                {"query": BOARD_IDS_QUERY},
+                headers=self.headers,
+                ttl=BOARD_IDS_CACHE_TTL,
+                cacheable=lambda body: "errors" not in body,
             )
-            data = response.json()
 
             boards = data.get("data", {}).get("boards", [])
             return [int(board["id"]) for board in boards]
@@ -96,69 +231,51 @@ class MondayMCPClient(BaseMCPClient):
 
     async def _fetch_board_items(
         self,
-        board_id: int,
+        board_ids: List[int],
         start_date: date,
         end_date: date
     ) -> List[MondayData]:
-        """Fetch items from a specific board"""
-        query = """
-        query ($boardId: ID!) {
-            boards(ids: [$boardId]) {
-                id
-                name
-                items_page {
-                    items {
-                        id
-                        name
-                        created_at
-                        updated_at
-                        column_values {
-                            id
-                            text
-                            value
-                        }
-                        updates {
-                            id
-                            body
-                            created_at
-                        }
-                    }
-                }
-            }
-        }
         """
-
+        Fetch items from a batch of boards in a single query, following each
+        board's cursor until its items fall before start_date
+        """
         try:
-            response = await self.http_client.post(
-                self.api_url,
-                json={"query": query, "variables": {"boardId": str(board_id)}}
+            data = await self._graphql(
+                BOARD_ITEMS_QUERY,
+                {"boardIds": [str(board_id) for board_id in board_ids]}
             )
-            data = response.json()
-
-            boards = data.get("data", {}).get("boards", [])
-            if not boards:
-                return []
-
-            board = boards[0]
-            board_name = board.get("name", "")
-            items_data = board.get("items_page", {}).get("items", [])
 
+            start_iso = start_date.isoformat()
             items = []
-            for item in items_data:
-                monday_item = self._parse_item(item, board_id, board_name, start_date, end_date)
-                if monday_item:
-                    items.append(monday_item)
+            for board in data.get("data", {}).get("boards", []):
+                board_id = board.get("id", "")
+                board_name = board.get("name", "")
+                page = board.get("items_page") or {}
+                while True:
+                    page_items = page.get("items", [])
+                    for item in page_items:
+                        monday_item = self._parse_item(item, board_id, board_name, start_date, end_date)
+                        if monday_item:
+                            items.append(monday_item)
+
+                    cursor = page.get("cursor")
+                    if not cursor or not page_items or page_items[-1].get("updated_at", "")[:10] < start_iso:
+                        break
+
+                    # Rebinding page drops the previous page so it can be collected
+                    data = await self._graphql(NEXT_ITEMS_PAGE_QUERY, {"cursor": cursor})
+                    page = data.get("data", {}).get("next_items_page") or {}
 
             return items
 
         except Exception as e:
-            self.logger.warning(f"Failed to fetch board {board_id}: {str(e)}")
+            self.logger.warning(f"Failed to fetch boards {board_ids}: {str(e)}")
             return []
 
     def _parse_item(
         self,
         item: Dict[str, Any],
-        board_id: int,
+        board_id: str,
         board_name: str,
         start_date: date,
         end_date: date
@@ -166,8 +283,8 @@ class MondayMCPClient(BaseMCPClient):
         """Parse Monday item into MondayData model"""
         try:
             # Parse dates
-            created_at = datetime.fromisoformat(item.get("created_at", "").replace("Z", "+00:00"))
-            updated_at = datetime.fromisoformat(item.get("updated_at", "").replace("Z", "+00:00"))
+            created_at = parse_iso(item.get("created_at", ""))
+            updated_at = parse_iso(item.get("updated_at", ""))
 
             # Filter by date range
             if created_at.date() < start_date or created_at.date() > end_date:
@@ -176,10 +293,8 @@ class MondayMCPClient(BaseMCPClient):
 
             # Parse column values
             column_values = {}
-            status = None
-            owner = None
+            fields: Dict[str, Optional[str]] = {"status": None, "owner": None, "priority": None}
             due_date = None
-            priority = None
 
             for col in item.get("column_values", []):
                 col_id = col.get("id", "")
@@ -187,39 +302,35 @@ class MondayMCPClient(BaseMCPClient):
                 column_values[col_id] = col_text
 
                 # Extract common columns
-                if col_id == "status":
-                    status = col_text
-                elif col_id == "person":
-                    owner = col_text
-                elif col_id in ["date", "due_date"]:
-                    if col_text:
-                        try:
-                            due_date = datetime.fromisoformat(col_text)
-                        except:
-                            pass
-                elif col_id == "priority":
-                    priority = col_text
+                field = self._COL_HANDLERS.get(col_id)
+                if field is not None:
+                    fields[field] = col_text
+                elif col_text and col_id in self._DATE_COLS:
+                    try:
+                        due_date = parse_iso(col_text)
+                    except ValueError:
+                        pass
 
             # Parse updates
             updates = []
-            for update in item.get("updates", [])[:5]:  # Limit to 5 recent updates
+            for update in item.get("updates", [])[:MAX_ITEM_UPDATES]:
                 updates.append({
                     "id": update.get("id"),
                     "body": update.get("body"),
                     "created_at": update.get("created_at"),
                 })
 
-            return MondayData(
+            return MondayData.fast(
                 item_id=item.get("id", ""),
                 board_id=str(board_id),
                 board_name=board_name,
                 item_name=item.get("name", ""),
-                status=status,
-                owner=owner,
+                status=fields["status"],
+                owner=fields["owner"],
                 created_at=created_at,
                 updated_at=updated_at,
                 due_date=due_date,
-                priority=priority,
+                priority=fields["priority"],
                 column_values=column_values,
                 updates=updates,
             )
@@ -230,24 +341,18 @@ class MondayMCPClient(BaseMCPClient):
 
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to Monday.com"""
-        query = "query { me { name } }"
-
         try:
-            response = await self.http_client.post(
-                self.api_url,
-                json={"query": query}
-            )
-            data = response.json()
+            data = await self._graphql(ME_QUERY)
 
             return {
                 "connected": "data" in data and "me" in data["data"],
                 "user": data.get("data", {}).get("me", {}).get("name"),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
@@ -1,7 +1,46 @@
 from typing import Any, Dict, List, Optional
-from datetime import date, datetime
+from datetime import date
 import httpx
 from ..base_client import BaseMCPClient, MCPClientError
+from ._cache import cached_get
+from ._http import get_shared_client
+from ._time import now_iso
+
+# Seconds to reuse a NewsAPI query result; headlines tolerate minutes of staleness
+NEWS_CACHE_TTL = 300.0
+
+# General tech headlines
+TECH_QUERY = "technology OR tech"
+TECH_DOMAINS = "techcrunch.com,theverge.com,arstechnica.com,wired.com,venturebeat.com,zdnet.com"
+
+# AI/ML news from reputable tech sources
+AI_QUERY = (
+    '"artificial intelligence" OR "machine learning" OR "AI" OR "LLM" OR "GPT" '
+    'OR "Claude" OR "ChatGPT" OR "deep learning"'
+)
+AI_DOMAINS = (
+    "techcrunch.com,theverge.com,arstechnica.com,wired.com,venturebeat.com,zdnet.com,"
+    "artificialintelligence-news.com,simonwillison.net"
+)
+
+# Internal developer portal / platform engineering news
+COMPETITOR_QUERY = (
+    '"backstage" OR "cortex" OR "opslevel" OR "roadie" OR "internal developer portal" '
+    'OR "IDP" OR "platform engineering" OR "developer experience"'
+)
+COMPETITOR_DOMAINS = "techcrunch.com,theverge.com,infoq.com,thenewstack.io,devops.com,venturebeat.com,zdnet.com"
+
+
+def _article_from_dict(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a NewsAPI article onto the briefing's article shape"""
+    return {
+        "title": article.get("title", ""),
+        "url": article.get("url", ""),
+        "content": article.get("description", ""),
+        # NewsAPI sends "source": null for some syndicated articles
+        "source": (article.get("source") or {}).get("name", ""),
+        "published_date": article.get("publishedAt")
+    }
 
 
 class NewsMCPClient(BaseMCPClient):
@@ -19,17 +58,15 @@ class NewsMCPClient(BaseMCPClient):
     async def connect(self) -> bool:
         """Establish connection"""
         try:
-            self.http_client = httpx.AsyncClient(timeout=30.0)
+            self.http_client = get_shared_client()
             self.logger.info("NewsAPI client connected successfully")
             return True
         except Exception as e:
             raise MCPClientError(f"Failed to connect to NewsAPI: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -80,30 +117,15 @@ class NewsMCPClient(BaseMCPClient):
         This is kept for backwards compatibility but returns general tech news
         """
         try:
-            url = f"{self.base_url}/everything"
-
             params = {
-                "apiKey": self.api_key,
-                "q": "technology OR tech",
+                "q": TECH_QUERY,
                 "language": "en",
                 "sortBy": "publishedAt",
                 "pageSize": max_results,
-                "domains": "techcrunch.com,theverge.com,arstechnica.com,wired.com,venturebeat.com,zdnet.com"
+                "domains": TECH_DOMAINS
             }
 
-            response = await self.http_client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for article in data.get("articles", [])[:max_results]:
-                articles.append({
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "content": article.get("description", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "published_date": article.get("publishedAt")
-                })
+            articles = await self._search(params, max_results)
 
             self.logger.info(f"Fetched {len(articles)} tech news articles")
             return articles
@@ -123,31 +145,16 @@ class NewsMCPClient(BaseMCPClient):
             List of articles with title, url, content, source, published_date
         """
         try:
-            url = f"{self.base_url}/everything"
-
             # Query for AI/ML news from reputable tech sources
             params = {
-                "apiKey": self.api_key,
-                "q": "\"artificial intelligence\" OR \"machine learning\" OR \"AI\" OR \"LLM\" OR \"GPT\" OR \"Claude\" OR \"ChatGPT\" OR \"deep learning\"",
+                "q": AI_QUERY,
                 "language": "en",
                 "sortBy": "publishedAt",
                 "pageSize": max_results,
-                "domains": "techcrunch.com,theverge.com,arstechnica.com,wired.com,venturebeat.com,zdnet.com,artificialintelligence-news.com,simonwillison.net"
+                "domains": AI_DOMAINS
             }
 
-            response = await self.http_client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for article in data.get("articles", [])[:max_results]:
-                articles.append({
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "content": article.get("description", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "published_date": article.get("publishedAt")
-                })
+            articles = await self._search(params, max_results)
 
             self.logger.info(f"Fetched {len(articles)} AI news articles")
             return articles
@@ -167,31 +174,16 @@ class NewsMCPClient(BaseMCPClient):
             List of articles with title, url, content, source, published_date
         """
         try:
-            url = f"{self.base_url}/everything"
-
             # Query for competitor and IDP news
             params = {
-                "apiKey": self.api_key,
-                "q": "\"backstage\" OR \"cortex\" OR \"opslevel\" OR \"roadie\" OR \"internal developer portal\" OR \"IDP\" OR \"platform engineering\" OR \"developer experience\"",
+                "q": COMPETITOR_QUERY,
                 "language": "en",
                 "sortBy": "publishedAt",
                 "pageSize": max_results,
-                "domains": "techcrunch.com,theverge.com,infoq.com,thenewstack.io,devops.com,venturebeat.com,zdnet.com"
+                "domains": COMPETITOR_DOMAINS
             }
 
-            response = await self.http_client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for article in data.get("articles", [])[:max_results]:
-                articles.append({
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "content": article.get("description", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "published_date": article.get("publishedAt")
-                })
+            articles = await self._search(params, max_results)
 
             self.logger.info(f"Fetched {len(articles)} competitor news articles")
             return articles
@@ -200,6 +192,18 @@ class NewsMCPClient(BaseMCPClient):
             self.logger.error(f"Error fetching competitor news: {str(e)}")
             raise MCPClientError(f"Failed to fetch competitor news: {str(e)}")
 
+    async def _search(self, params: Dict[str, Any], max_results: int) -> List[Dict[str, Any]]:
+        """Run a NewsAPI /everything query and return at most max_results articles"""
+        url = f"{self.base_url}/everything"
+        data = await cached_get(
+            self.http_client,
+            url,
+            params={"apiKey": self.api_key, **params},
+            ttl=NEWS_CACHE_TTL
+        )
+
+        return [_article_from_dict(article) for article in data.get("articles", [])[:max_results]]
+
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to NewsAPI"""
         try:
@@ -216,12 +220,13 @@ class NewsMCPClient(BaseMCPClient):
 
             return {
                 "connected": True,
-                "timestamp": datetime.utcnow().isoformat()
+                "http_version": response.http_version,
+                "timestamp": now_iso()
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
@@ -1,9 +1,42 @@
-from typing import Any, Dict, List, Optional
-from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import date, timedelta
+import asyncio
 import httpx
 from ..base_client import BaseMCPClient, MCPClientError
+from ._http import get_shared_client
+from ._time import now_iso, parse_iso
 from models.data_sources import NotionData
 
+# Maximum number of pages whose content is fetched at once
+MAX_CONCURRENT_PAGES = 10
+
+# Results per /search request (Notion's maximum)
+SEARCH_PAGE_SIZE = 100
+
+# Maximum number of pages whose rendered content is kept in memory
+MAX_CACHED_PAGES = 1000
+
+# page_id -> (last_edited_time, rendered content). Shared across client
+# instances so unchanged pages are not re-fetched on every briefing.
+_content_cache: Dict[str, Tuple[str, str]] = {}
+
+# Markdown prefix for each block type rendered into page content (others are skipped)
+_BLOCK_PREFIX = {
+    "paragraph": "",
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "- ",
+}
+
+
+def _plain_text(rich_text: Sequence[Dict[str, Any]]) -> str:
+    """Concatenate the plain_text of a Notion rich text array"""
+    if not rich_text:
+        return ""
+    # A list comprehension, not a generator: str.join builds a list either way
+    return "".join([t.get("plain_text", "") for t in rich_text])
+
 
 class NotionMCPClient(BaseMCPClient):
     """MCP Client for Notion"""
@@ -12,29 +45,25 @@ class NotionMCPClient(BaseMCPClient):
         super().__init__(config)
         self.api_token = config.get("NOTION_API_TOKEN")
         self.api_url = "https://api.notion.com/v1"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Notion-Version": "2022-06-28",
+            "Content-Type": "application/json"
+        }
         self.http_client: Optional[httpx.AsyncClient] = None
 
     async def connect(self) -> bool:
         """Establish connection to Notion"""
         try:
-            self.http_client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "Authorization": f"Bearer {self.api_token}",
-                    "Notion-Version": "2022-06-28",
-                    "Content-Type": "application/json"
-                }
-            )
+            self.http_client = get_shared_client()
             self.logger.info("Notion MCP client connected successfully")
             return True
         except Exception as e:
             raise MCPClientError(f"Failed to connect to Notion: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -56,11 +85,15 @@ class NotionMCPClient(BaseMCPClient):
             # Search for pages edited in the date range
             pages = await self._search_pages(start_date, end_date)
 
-            notion_pages = []
-            for page in pages:
-                notion_page = await self._parse_page(page)
-                if notion_page:
-                    notion_pages.append(notion_page)
+            # Each page's content is a separate request; fetch them concurrently
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+            async def parse_one(page: Dict[str, Any]) -> Optional[NotionData]:
+                async with semaphore:
+                    return await self._parse_page(page)
+
+            parsed = await asyncio.gather(*(parse_one(page) for page in pages))
+            notion_pages = [page for page in parsed if page]
 
             self.logger.info(f"Fetched {len(notion_pages)} Notion pages")
             return notion_pages
@@ -73,9 +106,10 @@ class NotionMCPClient(BaseMCPClient):
         """Search for pages in date range"""
         url = f"{self.api_url}/search"
 
-        # Convert to ISO format
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
+        # Notion timestamps are UTC RFC 3339 strings ("2024-01-31T09:30:00.000Z"),
+        # which sort chronologically, so the range check needs no parsing
+        start_iso = f"{start_date.isoformat()}T00:00:00.000Z"
+        end_iso = f"{end_date.isoformat()}T23:59:59.999Z"
 
         payload = {
             "filter": {
@@ -85,23 +119,32 @@ class NotionMCPClient(BaseMCPClient):
             "sort": {
                 "direction": "descending",
                 "timestamp": "last_edited_time"
-            }
+            },
+            "page_size": SEARCH_PAGE_SIZE
         }
 
         try:
-            response = await self.http_client.post(url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            # Filter by date range
             pages = []
-            for page in data.get("results", []):
-                last_edited = page.get("last_edited_time", "")
-                if last_edited:
-                    edited_dt = datetime.fromisoformat(last_edited.replace("Z", "+00:00"))
-                    if start_datetime <= edited_dt <= end_datetime:
+            while True:
+                data = await self._post_json(url, headers=self.headers, json=payload)
+
+                # Results are newest-edited first, so stop at the first page
+                # edited before the range
+                reached_start = False
+                for page in data.get("results", []):
+                    last_edited = page.get("last_edited_time", "")
+                    if not last_edited:
+                        continue
+                    if last_edited < start_iso:
+                        reached_start = True
+                        break
+                    if last_edited <= end_iso:
                         pages.append(page)
 
+                if reached_start or not data.get("has_more") or not data.get("next_cursor"):
+                    break
+                payload["start_cursor"] = data["next_cursor"]
+
             return pages
 
         except Exception as e:
@@ -117,25 +160,22 @@ class NotionMCPClient(BaseMCPClient):
             title = self._extract_title(page)
 
             # Parse timestamps
-            created_time = datetime.fromisoformat(
-                page.get("created_time", "").replace("Z", "+00:00")
-            )
-            last_edited_time = datetime.fromisoformat(
-                page.get("last_edited_time", "").replace("Z", "+00:00")
-            )
+            created_time = parse_iso(page.get("created_time", ""))
+            last_edited_time = parse_iso(page.get("last_edited_time", ""))
 
             # Parent info
             parent = page.get("parent", {})
             parent_type = parent.get("type")
-            parent_id = parent.get(parent_type) if parent_type else None
+            # Workspace-level pages carry "workspace": true rather than an ID
+            parent_id = parent.get(parent_type) if parent_type not in (None, "workspace") else None
 
             # Extract properties
             properties = self._extract_properties(page.get("properties", {}))
 
-            # Fetch page content
-            content = await self._fetch_page_content(page_id)
+            # Fetch page content (reused if the page hasn't been edited since)
+            content = await self._get_page_content(page_id, page.get("last_edited_time", ""))
 
-            return NotionData(
+            return NotionData.fast(
                 page_id=page_id,
                 title=title,
                 parent_id=parent_id,
@@ -159,9 +199,9 @@ class NotionMCPClient(BaseMCPClient):
 
         for prop_name, prop_data in properties.items():
             if prop_data.get("type") == "title":
-                title_array = prop_data.get("title", [])
+                title_array = prop_data.get("title", ())
                 if title_array:
-                    return "".join([t.get("plain_text", "") for t in title_array])
+                    return _plain_text(title_array)
 
         return "Untitled"
 
@@ -173,16 +213,14 @@ class NotionMCPClient(BaseMCPClient):
             prop_type = prop_data.get("type")
 
             if prop_type == "title":
-                title_array = prop_data.get("title", [])
-                simplified[prop_name] = "".join([t.get("plain_text", "") for t in title_array])
+                simplified[prop_name] = _plain_text(prop_data.get("title", ()))
             elif prop_type == "rich_text":
-                text_array = prop_data.get("rich_text", [])
-                simplified[prop_name] = "".join([t.get("plain_text", "") for t in text_array])
+                simplified[prop_name] = _plain_text(prop_data.get("rich_text", ()))
             elif prop_type == "select":
                 select = prop_data.get("select")
                 simplified[prop_name] = select.get("name") if select else None
             elif prop_type == "multi_select":
-                multi_select = prop_data.get("multi_select", [])
+                multi_select = prop_data.get("multi_select", ())
                 simplified[prop_name] = [s.get("name") for s in multi_select]
             elif prop_type == "date":
                 date_obj = prop_data.get("date")
@@ -193,63 +231,66 @@ class NotionMCPClient(BaseMCPClient):
 
         return simplified
 
-    async def _fetch_page_content(self, page_id: str) -> str:
-        """Fetch page content as markdown"""
-        try:
-            url = f"{self.api_url}/blocks/{page_id}/children"
-            response = await self.http_client.get(url)
+    async def _get_page_content(self, page_id: str, last_edited: str) -> str:
+        """Return page content as markdown, from cache when last_edited_time is unchanged"""
+        cached = _content_cache.get(page_id)
+        if cached is not None and cached[0] == last_edited:
+            return cached[1]
+
+        content = await self._fetch_page_content(page_id)
+        if content is None:
+            return ""
 
-            if response.status_code != 200:
-                return ""
+        if page_id not in _content_cache and len(_content_cache) >= MAX_CACHED_PAGES:
+            # Drop the oldest insertion
+            del _content_cache[next(iter(_content_cache))]
+        _content_cache[page_id] = (last_edited, content)
+        return content
 
-            data = response.json()
+    async def _fetch_page_content(self, page_id: str) -> Optional[str]:
+        """Fetch page content as markdown (None if it could not be fetched)"""
+        try:
+            url = f"{self.api_url}/blocks/{page_id}/children"
+            data = await self._get_json(url, headers=self.headers)
             blocks = data.get("results", [])
 
             # Simple markdown conversion
             content_parts = []
             for block in blocks:
                 block_type = block.get("type")
-                block_data = block.get(block_type, {})
-
-                if block_type == "paragraph":
-                    text = self._extract_text_from_block(block_data)
-                    if text:
-                        content_parts.append(text)
-                elif block_type in ["heading_1", "heading_2", "heading_3"]:
-                    text = self._extract_text_from_block(block_data)
-                    level = block_type[-1]
-                    if text:
-                        content_parts.append(f"{'#' * int(level)} {text}")
-                elif block_type == "bulleted_list_item":
-                    text = self._extract_text_from_block(block_data)
-                    if text:
-                        content_parts.append(f"- {text}")
+
+                prefix = _BLOCK_PREFIX.get(block_type)
+                if prefix is None:
+                    continue
+
+                text = self._extract_text_from_block(block.get(block_type, {}))
+                if text:
+                    content_parts.append(prefix + text)
 
             return "\n\n".join(content_parts)
 
         except Exception as e:
             self.logger.warning(f"Failed to fetch page content: {str(e)}")
-            return ""
+            return None
 
     def _extract_text_from_block(self, block_data: Dict[str, Any]) -> str:
         """Extract plain text from block"""
-        rich_text = block_data.get("rich_text", [])
-        return "".join([t.get("plain_text", "") for t in rich_text])
+        return _plain_text(block_data.get("rich_text", ()))
 
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to Notion"""
         try:
             url = f"{self.api_url}/users/me"
-            response = await self.http_client.get(url)
+            response = await self.http_client.get(url, headers=self.headers)
 
             return {
                 "connected": response.status_code == 200,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
@@ -1,9 +1,31 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import date, datetime, timedelta
+import asyncio
 import httpx
+import orjson
 from ..base_client import BaseMCPClient, MCPClientError
+from ._http import get_shared_client
+from ._time import now_iso
 from models.data_sources import SlackData
 
+# Maximum number of channels fetched at once (keeps us under Slack's rate limits)
+MAX_CONCURRENT_CHANNELS = 20
+
+# Maximum number of messages being parsed at once across all channels; parsing
+# may call users.info / conversations.replies
+MAX_CONCURRENT_MESSAGES = 50
+
+# Page size for users.list (Slack caps this at 1000)
+USERS_PAGE_LIMIT = 1000
+
+# Page size for conversations.history (Slack caps this at 1000)
+HISTORY_PAGE_LIMIT = 1000
+
+# Reactions that mark a thread as VIP on their own
+_IMPORTANT_EMOJIS = frozenset({
+    "fire", "eyes", "100", "rocket", "star", "warning", "rotating_light", "sos"
+})
+
 
 class SlackMCPClient(BaseMCPClient):
     """MCP Client for Slack"""
@@ -11,19 +33,24 @@ class SlackMCPClient(BaseMCPClient):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.bot_token = config.get("SLACK_BOT_TOKEN")
+        self.headers = {"Authorization": f"Bearer {self.bot_token}"}
         self.http_client: Optional[httpx.AsyncClient] = None
         self.bot_user_id: Optional[str] = None
+        # users.info / conversations.info results, and lookups currently in flight
+        self._user_cache: Dict[str, Optional[str]] = {}
+        self._channel_cache: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Set once the workspace's users have been loaded via users.list
+        self._users_primed = asyncio.Event()
+        self._users_priming = False
+        self._message_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MESSAGES)
 
     async def connect(self) -> bool:
         """Establish connection to Slack"""
         try:
-            self.http_client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={"Authorization": f"Bearer {self.bot_token}"}
-            )
+            self.http_client = get_shared_client()
             # Test auth and get bot user ID
-            response = await self.http_client.get("https://slack.com/api/auth.test")
-            data = response.json()
+            data = await self._get_json("https://slack.com/api/auth.test", headers=self.headers)
             if not data.get("ok"):
                 raise MCPClientError(f"Slack auth failed: {data.get('error')}")
 
@@ -34,10 +61,8 @@ class SlackMCPClient(BaseMCPClient):
             raise MCPClientError(f"Failed to connect to Slack: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def fetch_data(
         self,
@@ -61,12 +86,27 @@ class SlackMCPClient(BaseMCPClient):
         if channels is None:
             channels = await self._get_channels()
 
+        # Convert dates to Unix timestamps once for every channel
+        oldest = datetime.combine(start_date, datetime.min.time()).timestamp()
+        latest = datetime.combine(end_date, datetime.max.time()).timestamp()
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNELS)
+
+        async def fetch_channel(channel_id: str) -> List[SlackData]:
+            async with semaphore:
+                return await self._fetch_channel_messages(channel_id, oldest, latest)
+
+        results = await asyncio.gather(
+            *(fetch_channel(channel_id) for channel_id in channels),
+            return_exceptions=True
+        )
+
         messages = []
-        for channel_id in channels:
-            channel_messages = await self._fetch_channel_messages(
-                channel_id, start_date, end_date
-            )
-            messages.extend(channel_messages)
+        for channel_id, result in zip(channels, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error fetching from channel {channel_id}: {str(result)}")
+                continue
+            messages.extend(result)
 
         self.logger.info(f"Fetched {len(messages)} Slack messages")
         return messages
@@ -74,14 +114,14 @@ class SlackMCPClient(BaseMCPClient):
     async def _get_channels(self) -> List[str]:
         """Get list of channels the bot is a member of, including DMs"""
         try:
-            response = await self.http_client.get(
+            data = await self._get_json(
                 "https://slack.com/api/conversations.list",
+                headers=self.headers,
                 params={
                     "types": "public_channel,private_channel,im",
                     "exclude_archived": "true"
                 }
             )
-            data = response.json()
 
             if not data.get("ok"):
                 raise MCPClientError(f"Failed to get channels: {data.get('error')}")
@@ -106,25 +146,33 @@ class SlackMCPClient(BaseMCPClient):
     async def _fetch_channel_messages(
         self,
         channel_id: str,
-        start_date: date,
-        end_date: date
+        oldest: float,
+        latest: float
     ) -> List[SlackData]:
-        """Fetch messages from a specific channel"""
+        """
+        Fetch messages from a specific channel
+
+        Follows conversations.history cursors, parsing each page while the
+        next one is being requested.
+
+        Args:
+            channel_id: Channel to read
+            oldest: Start of the range as a Unix timestamp
+            latest: End of the range as a Unix timestamp
+        """
         try:
-            # Convert dates to Unix timestamps
-            oldest = datetime.combine(start_date, datetime.min.time()).timestamp()
-            latest = datetime.combine(end_date, datetime.max.time()).timestamp()
+            params = {
+                "channel": channel_id,
+                "oldest": oldest,
+                "latest": latest,
+                "limit": HISTORY_PAGE_LIMIT
+            }
 
-            response = await self.http_client.get(
+            data = await self._get_json(
                 "https://slack.com/api/conversations.history",
-                params={
-                    "channel": channel_id,
-                    "oldest": oldest,
-                    "latest": latest,
-                    "limit": 1000
-                }
+                headers=self.headers,
+                params=params
             )
-            data = response.json()
 
             if not data.get("ok"):
                 error = data.get('error')
@@ -133,16 +181,50 @@ class SlackMCPClient(BaseMCPClient):
                     self.logger.warning(f"Failed to fetch from {channel_id}: {error}")
                 return []
 
-            # Get channel info
-            channel_info = await self._get_channel_info(channel_id)
-            channel_name = channel_info.get("name", channel_id)
-            is_dm_channel = channel_info.get("is_im", False)
-
-            messages = []
-            for msg in data.get("messages", []):
-                slack_msg = await self._parse_message(msg, channel_id, channel_name, is_dm_channel)
-                if slack_msg:
-                    messages.append(slack_msg)
+            # Pages of raw messages; None marks the end of the history
+            pages: asyncio.Queue = asyncio.Queue()
+
+            async def produce(page: Dict[str, Any]) -> None:
+                try:
+                    while True:
+                        pages.put_nowait(page.get("messages", []))
+                        cursor = page.get("response_metadata", {}).get("next_cursor")
+                        if not page.get("has_more") or not cursor:
+                            break
+                        page = await self._get_json(
+                            "https://slack.com/api/conversations.history",
+                            headers=self.headers,
+                            params={**params, "cursor": cursor}
+                        )
+                        if not page.get("ok"):
+                            self.logger.warning(
+                                f"Failed to fetch more from {channel_id}: {page.get('error')}"
+                            )
+                            break
+                except Exception as e:
+                    self.logger.warning(f"Error paging channel {channel_id}: {str(e)}")
+                finally:
+                    pages.put_nowait(None)
+
+            producer = asyncio.create_task(produce(data))
+            del data
+
+            try:
+                # Get channel info
+                channel_info = await self._get_channel_info(channel_id)
+                channel_name = channel_info.get("name", channel_id)
+                is_dm_channel = channel_info.get("is_im", False)
+
+                async def parse_one(msg: Dict[str, Any]) -> Optional[SlackData]:
+                    async with self._message_semaphore:
+                        return await self._parse_message(msg, channel_id, channel_name, is_dm_channel)
+
+                messages = []
+                while (batch := await pages.get()) is not None:
+                    parsed = await asyncio.gather(*(parse_one(msg) for msg in batch))
+                    messages.extend(msg for msg in parsed if msg is not None)
+            finally:
+                producer.cancel()
 
             return messages
 
@@ -150,14 +232,48 @@ class SlackMCPClient(BaseMCPClient):
             self.logger.warning(f"Error fetching from channel {channel_id}: {str(e)}")
             return []
 
+    async def _cached_lookup(
+        self,
+        cache: Dict[str, Any],
+        key: str,
+        fetch: Callable[[str], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return cache[key], fetching it once if missing
+
+        Concurrent misses for the same key share a single request.
+        """
+        if key in cache:
+            return cache[key]
+
+        flight_key = f"{id(cache)}:{key}"
+        pending = self._in_flight.get(flight_key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch(key))
+            self._in_flight[flight_key] = pending
+
+            def _done(task: asyncio.Future) -> None:
+                self._in_flight.pop(flight_key, None)
+                if not task.cancelled() and task.exception() is None:
+                    cache[key] = task.result()
+
+            pending.add_done_callback(_done)
+
+        # Shield so a cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(pending)
+
     async def _get_channel_info(self, channel_id: str) -> Dict[str, Any]:
-        """Get channel information"""
+        """Get channel information (cached per client)"""
+        return await self._cached_lookup(self._channel_cache, channel_id, self._fetch_channel_info)
+
+    async def _fetch_channel_info(self, channel_id: str) -> Dict[str, Any]:
+        """Request channel information from conversations.info"""
         try:
-            response = await self.http_client.get(
+            data = await self._get_json(
                 "https://slack.com/api/conversations.info",
+                headers=self.headers,
                 params={"channel": channel_id}
             )
-            data = response.json()
             return data.get("channel", {})
         except:
             return {}
@@ -181,7 +297,7 @@ class SlackMCPClient(BaseMCPClient):
             user_name = await self._get_user_name(user_id)
 
             # Parse timestamp
-            ts = float(msg.get("ts", "0"))
+            ts = float(msg.get("ts") or 0.0)
             timestamp = datetime.fromtimestamp(ts)
 
             # Extract reactions
@@ -189,17 +305,17 @@ class SlackMCPClient(BaseMCPClient):
 
             # Check if bot is mentioned
             text = msg.get("text", "")
-            is_mention = self.bot_user_id and f"<@{self.bot_user_id}>" in text
+            is_mention = bool(self.bot_user_id) and f"<@{self.bot_user_id}>" in text
 
             # Check if DM is unanswered (only for DMs)
             is_dm_unanswered = False
             if is_dm_channel:
-                is_dm_unanswered = await self._is_dm_unanswered(channel_id, msg.get("ts", ""))
+                is_dm_unanswered = await self._is_dm_unanswered(channel_id, msg)
 
             # Check if VIP thread
             is_vip_thread = self._is_vip_thread(msg)
 
-            return SlackData(
+            return SlackData.fast(
                 channel_id=channel_id,
                 channel_name=channel_name,
                 message_id=msg.get("ts", ""),
@@ -222,13 +338,56 @@ class SlackMCPClient(BaseMCPClient):
             return None
 
     async def _get_user_name(self, user_id: str) -> Optional[str]:
-        """Get user display name"""
+        """Get user display name (cached per client)"""
+        await self._prime_user_cache()
+        # Users missing from users.list (e.g. from shared channels) are looked up individually
+        return await self._cached_lookup(self._user_cache, user_id, self._fetch_user_name)
+
+    async def _prime_user_cache(self) -> None:
+        """Load every workspace user's display name with users.list (once per client)"""
+        if self._users_primed.is_set():
+            return
+        if self._users_priming:
+            await self._users_primed.wait()
+            return
+
+        self._users_priming = True
+        try:
+            cursor = None
+            while True:
+                params = {"limit": USERS_PAGE_LIMIT}
+                if cursor:
+                    params["cursor"] = cursor
+                data = await self._get_json(
+                    "https://slack.com/api/users.list",
+                    headers=self.headers,
+                    params=params
+                )
+                if not data.get("ok"):
+                    self.logger.warning(f"Failed to list Slack users: {data.get('error')}")
+                    break
+
+                for user in data.get("members", []):
+                    self._user_cache[user["id"]] = (
+                        user.get("profile", {}).get("display_name") or user.get("name")
+                    )
+
+                cursor = data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except Exception as e:
+            self.logger.warning(f"Error listing Slack users: {str(e)}")
+        finally:
+            self._users_primed.set()
+
+    async def _fetch_user_name(self, user_id: str) -> Optional[str]:
+        """Request a user's display name from users.info"""
         try:
-            response = await self.http_client.get(
+            data = await self._get_json(
                 "https://slack.com/api/users.info",
+                headers=self.headers,
                 params={"user": user_id}
             )
-            data = response.json()
             if data.get("ok"):
                 user = data.get("user", {})
                 return user.get("profile", {}).get("display_name") or user.get("name")
@@ -236,27 +395,34 @@ class SlackMCPClient(BaseMCPClient):
             pass
         return None
 
-    async def _is_dm_unanswered(self, channel_id: str, message_ts: str) -> bool:
+    async def _is_dm_unanswered(self, channel_id: str, msg: Dict[str, Any]) -> bool:
         """
         Check if a DM has been answered by the bot user.
 
         Args:
             channel_id: Channel ID of the DM
-            message_ts: Timestamp of the original message
+            msg: The original message, as returned by conversations.history
 
         Returns:
             True if the DM is unanswered, False if bot has replied
         """
+        # Thread metadata on the message usually settles it without fetching replies
+        if not msg.get("reply_count"):
+            return True
+        if self.bot_user_id in msg.get("reply_users", []):
+            return False
+
+        message_ts = msg.get("ts", "")
         try:
             # Check if there are any replies in the thread
-            response = await self.http_client.get(
+            data = await self._get_json(
                 "https://slack.com/api/conversations.replies",
+                headers=self.headers,
                 params={
                     "channel": channel_id,
                     "ts": message_ts
                 }
             )
-            data = response.json()
 
             if not data.get("ok"):
                 return True  # Assume unanswered if we can't check
@@ -284,39 +450,38 @@ class SlackMCPClient(BaseMCPClient):
         Returns:
             True if message is a VIP thread
         """
-        # Count total reactions
-        reactions = msg.get("reactions", [])
-        total_reaction_count = sum(r.get("count", 0) for r in reactions)
-
-        # Important emojis that signal VIP threads
-        important_emojis = ["fire", "eyes", "100", "rocket", "star", "warning", "rotating_light", "sos"]
-        has_important_emoji = any(
-            r.get("name", "") in important_emojis
-            for r in reactions
-        )
+        # VIP criteria: 5+ replies OR important emoji OR 3+ reactions.
+        # Check the reply count first (no loop), then stop at the first
+        # reaction that settles it
+        if msg.get("reply_count", 0) >= 5:
+            return True
 
-        # High reply count also signals VIP
-        reply_count = msg.get("reply_count", 0)
+        total_reaction_count = 0
+        for r in msg.get("reactions", ()):
+            if r.get("name", "") in _IMPORTANT_EMOJIS:
+                return True
+            total_reaction_count += r.get("count", 0)
+            if total_reaction_count >= 3:
+                return True
 
-        # VIP criteria: 3+ reactions OR important emoji OR 5+ replies
-        return total_reaction_count >= 3 or has_important_emoji or reply_count >= 5
+        return False
 
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to Slack"""
         try:
-            response = await self.http_client.get("https://slack.com/api/auth.test")
-            data = response.json()
+            response = await self.http_client.get("https://slack.com/api/auth.test", headers=self.headers)
+            data = orjson.loads(response.content)
 
             return {
                 "connected": data.get("ok", False),
                 "team": data.get("team"),
                 "user": data.get("user"),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
 
         except Exception as e:
             return {
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
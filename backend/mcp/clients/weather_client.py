@@ -1,8 +1,16 @@
 from typing import Any, Dict, Optional
 from datetime import date
+import asyncio
 import httpx
+import orjson
 import json
 from ..base_client import BaseMCPClient, MCPClientError
+from ._http import get_shared_client
+
+# The server's IP location is effectively constant, so it is detected once per
+# process and shared by every client instance
+_location_cache: Optional[Dict[str, Any]] = None
+_location_lock = asyncio.Lock()
 
 
 class WeatherMCPClient(BaseMCPClient):
@@ -20,7 +28,7 @@ class WeatherMCPClient(BaseMCPClient):
     async def connect(self) -> bool:
         """Establish connection and detect location"""
         try:
-            self.http_client = httpx.AsyncClient(timeout=30.0)
+            self.http_client = get_shared_client()
 
             # Get location from IP
             await self._detect_location()
@@ -31,20 +39,26 @@ class WeatherMCPClient(BaseMCPClient):
             raise MCPClientError(f"Failed to connect to Weather API: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close HTTP client"""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
+        """Release the shared HTTP client (it is closed on application shutdown)"""
+        self.http_client = None
 
     async def _detect_location(self) -> None:
-        """Detect location based on IP address"""
+        """Detect location based on IP address (cached for the process)"""
+        global _location_cache
+        async with _location_lock:
+            if _location_cache is None:
+                _location_cache = await self._lookup_ip_location()
+        self.location = dict(_location_cache) if _location_cache else self._default_location()
+
+    async def _lookup_ip_location(self) -> Optional[Dict[str, Any]]:
+        """Look up the server's location from its IP (None if the lookup fails)"""
         try:
             # Use ipapi.co for free IP geolocation
             response = await self.http_client.get("https://ipapi.co/json/")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            self.location = {
+            return {
                 "city": data.get("city", "Unknown"),
                 "region": data.get("region", ""),
                 "country": data.get("country_name", ""),
@@ -54,15 +68,18 @@ class WeatherMCPClient(BaseMCPClient):
             }
         except Exception as e:
             self.logger.warning(f"Failed to detect location: {e}, using default")
-            # Fallback to a default location (New York)
-            self.location = {
-                "city": "New York",
-                "region": "NY",
-                "country": "United States",
-                "lat": 40.7128,
-                "lon": -74.0060,
-                "timezone": "America/New_York"
-            }
+            return None
+
+    def _default_location(self) -> Dict[str, Any]:
+        """Fallback location (New York) used when IP geolocation fails"""
+        return {
+            "city": "New York",
+            "region": "NY",
+            "country": "United States",
+            "lat": 40.7128,
+            "lon": -74.0060,
+            "timezone": "America/New_York"
+        }
 
     async def fetch_data(
         self,
@@ -79,8 +96,11 @@ class WeatherMCPClient(BaseMCPClient):
         if not self.location:
             await self._detect_location()
 
-        current = await self.fetch_current_weather()
-        forecast = await self.fetch_forecast()
+        # Independent requests to the same host; run them together
+        current, forecast = await asyncio.gather(
+            self.fetch_current_weather(),
+            self.fetch_forecast()
+        )
 
         return {
             "current": current,
@@ -101,7 +121,7 @@ class WeatherMCPClient(BaseMCPClient):
 
             response = await self.http_client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return {
                 "temperature": data["main"]["temp"],
@@ -132,7 +152,7 @@ class WeatherMCPClient(BaseMCPClient):
 
             response = await self.http_client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             forecast = []
             for item in data["list"][:8]:  # Next 24 hours
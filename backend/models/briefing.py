@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from datetime import date as DateType
 from typing import List, Optional, Dict, Any
@@ -39,6 +39,42 @@ class DataSourceStatus(BaseModel):
     collected_at: Optional[datetime] = Field(None, description="Timestamp of collection")
 
 
+def _briefing_schema_example(schema: Dict[str, Any]) -> None:
+    """Attach the Briefing example to its JSON schema when the schema is generated"""
+    schema["example"] = {
+        "id": "briefing-2026-01-07",
+        "date": "2026-01-07",
+        "status": "completed",
+        "summary": {
+            "key_highlights": [
+                "Q1 demo calls show 15% increase in feature requests",
+                "Product marketing campaign draft needs review by EOD",
+                "3 high-priority customer issues escalated from support"
+            ],
+            "action_items": [
+                "Review PMM campaign draft in Notion",
+                "Schedule follow-up calls for top 3 demo prospects"
+            ]
+        },
+        "sections": [
+            {
+                "title": "Customer Calls & Demos",
+                "content": "## Recent Calls\n- Acme Corp demo went well...",
+                "priority": 10,
+                "source_count": 2
+            }
+        ],
+        "data_sources": [
+            {
+                "source_name": "gmail",
+                "status": "success",
+                "items_collected": 45,
+                "collected_at": "2026-01-07T09:00:00Z"
+            }
+        ]
+    }
+
+
 class Briefing(BaseModel):
     """Complete daily briefing model"""
     id: str = Field(..., description="Unique briefing identifier")
@@ -65,41 +101,7 @@ class Briefing(BaseModel):
         description="Raw collected data (optional, for debugging)"
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "briefing-2026-01-07",
-                "date": "2026-01-07",
-                "status": "completed",
-                "summary": {
-                    "key_highlights": [
-                        "Q1 demo calls show 15% increase in feature requests",
-                        "Product marketing campaign draft needs review by EOD",
-                        "3 high-priority customer issues escalated from support"
-                    ],
-                    "action_items": [
-                        "Review PMM campaign draft in Notion",
-                        "Schedule follow-up calls for top 3 demo prospects"
-                    ]
-                },
-                "sections": [
-                    {
-                        "title": "Customer Calls & Demos",
-                        "content": "## Recent Calls\n- Acme Corp demo went well...",
-                        "priority": 10,
-                        "source_count": 2
-                    }
-                ],
-                "data_sources": [
-                    {
-                        "source_name": "gmail",
-                        "status": "success",
-                        "items_collected": 45,
-                        "collected_at": "2026-01-07T09:00:00Z"
-                    }
-                ]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_briefing_schema_example)
 
 
 class BriefingCreateRequest(BaseModel):
@@ -1,9 +1,15 @@
 from pydantic import BaseModel, Field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import FrozenSet, List, Optional, Dict, Any, Type, TypeVar
 from enum import Enum
 
 
+def _utc_now() -> datetime:
+    """Timezone-aware current UTC time for default timestamps"""
+    return datetime.now(timezone.utc)
+
+
 class DataSourceType(str, Enum):
     """Supported data source types"""
     GMAIL = "gmail"
@@ -20,12 +26,30 @@ class DataSourceType(str, Enum):
 class DataSource(BaseModel):
     """Base data source model"""
     source_type: DataSourceType
-    collected_at: datetime = Field(default_factory=datetime.utcnow)
+    collected_at: datetime = Field(default_factory=_utc_now)
     item_count: int = 0
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class EmailData(BaseModel):
+_M = TypeVar("_M", bound="IngestedModel")
+
+
+class IngestedModel(BaseModel):
+    """Base for items built from already-parsed provider responses"""
+
+    @classmethod
+    def fast(cls: Type[_M], **data: Any) -> _M:
+        """
+        Build an instance without running validation.
+
+        The caller must pass values of the declared field types (datetimes
+        already parsed, lists not None, etc.); use the normal constructor
+        wherever the input is not trusted.
+        """
+        return cls.model_construct(**data)
+
+
+class EmailData(IngestedModel):
     """Email data from Gmail"""
     id: str = Field(..., description="Email message ID")
     thread_id: str = Field(..., description="Email thread ID")
@@ -41,8 +65,13 @@ class EmailData(BaseModel):
     has_attachments: bool = Field(default=False, description="Has attachments")
     snippet: str = Field(default="", description="Email snippet/preview")
 
+    @cached_property
+    def label_set(self) -> FrozenSet[str]:
+        """Labels as a frozenset for O(1) membership checks (e.g. UNREAD, CATEGORY_*)"""
+        return frozenset(self.labels)
+
 
-class CalendarEvent(BaseModel):
+class CalendarEvent(IngestedModel):
     """Calendar event from Google Calendar"""
     id: str = Field(..., description="Event ID")
     summary: str = Field(..., description="Event title")
@@ -56,7 +85,7 @@ class CalendarEvent(BaseModel):
     is_all_day: bool = Field(default=False, description="All-day event")
 
 
-class SlackData(BaseModel):
+class SlackData(IngestedModel):
     """Slack message data"""
     channel_id: str = Field(..., description="Slack channel ID")
     channel_name: str = Field(..., description="Slack channel name")
@@ -75,7 +104,7 @@ class SlackData(BaseModel):
     attachments: List[Dict[str, Any]] = Field(default_factory=list, description="Message attachments")
 
 
-class GongData(BaseModel):
+class GongData(IngestedModel):
     """Gong call recording data"""
     call_id: str = Field(..., description="Gong call ID")
     title: str = Field(..., description="Call title")
@@ -92,7 +121,7 @@ class GongData(BaseModel):
     next_steps: Optional[str] = Field(None, description="Agreed next steps")
 
 
-class MondayData(BaseModel):
+class MondayData(IngestedModel):
     """Monday.com board/item data"""
     item_id: str = Field(..., description="Monday item ID")
     board_id: str = Field(..., description="Board ID")
@@ -108,7 +137,7 @@ class MondayData(BaseModel):
     updates: List[Dict[str, Any]] = Field(default_factory=list, description="Recent updates/comments")
 
 
-class NotionData(BaseModel):
+class NotionData(IngestedModel):
     """Notion page data"""
     page_id: str = Field(..., description="Notion page ID")
     title: str = Field(..., description="Page title")
@@ -124,7 +153,7 @@ class NotionData(BaseModel):
     url: Optional[str] = Field(None, description="Public URL if shared")
 
 
-class MiroData(BaseModel):
+class MiroData(IngestedModel):
     """Miro board data"""
     board_id: str = Field(..., description="Miro board ID")
     board_name: str = Field(..., description="Board name")
@@ -152,7 +181,7 @@ class WeatherData(BaseModel):
     forecast: List[Dict[str, Any]] = Field(default_factory=list, description="24-hour forecast")
 
 
-class NewsArticle(BaseModel):
+class NewsArticle(IngestedModel):
     """News article data from NewsAPI"""
     title: str = Field(..., description="Article title")
     url: str = Field(..., description="Article URL")
@@ -163,7 +192,7 @@ class NewsArticle(BaseModel):
 
 class CollectedData(BaseModel):
     """Container for all collected data from various sources"""
-    collection_date: datetime = Field(default_factory=datetime.utcnow)
+    collection_date: datetime = Field(default_factory=_utc_now)
 
     # Data from each source
     emails: List[EmailData] = Field(default_factory=list)
@@ -180,16 +209,9 @@ class CollectedData(BaseModel):
 
     def get_total_items(self) -> int:
         """Get total number of items collected across all sources"""
+        # get_source_counts counts only news_articles; add the AI and competitor feeds
         return (
-            len(self.emails)
-            + len(self.calendar_events)
-            + len(self.slack_messages)
-            + len(self.gong_calls)
-            + len(self.monday_items)
-            + len(self.notion_pages)
-            + len(self.miro_boards)
-            + (1 if self.weather else 0)
-            + len(self.news_articles)
+            sum(self.get_source_counts().values())
             + len(self.ai_news_articles)
             + len(self.competitor_news_articles)
         )
@@ -20,7 +20,6 @@ This script will:
 
 import sys
 from urllib.parse import urlencode
-import httpx
 
 # Scopes needed for Gmail and Calendar access
 SCOPES = [
@@ -32,6 +31,8 @@ REDIRECT_URI = "urn:ietf:wg:oauth:2.0:oob"  # For desktop/CLI apps
 
 
 def main():
+    import httpx  # imported here so importing SCOPES stays cheap
+
     print("=" * 70)
     print("Google OAuth 2.0 Setup Helper")
     print("=" * 70)
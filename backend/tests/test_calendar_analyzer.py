@@ -0,0 +1,192 @@
+"""
+Differential tests for the calendar sweep against the original pairwise scan.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from models.data_sources import CalendarEvent
+from utils.calendar_analyzer import analyze_calendar, detect_overlapping_events
+
+
+def _ref(event):
+    return {
+        "id": event.id,
+        "summary": event.summary,
+        "start_time": event.start_time.isoformat(),
+        "end_time": event.end_time.isoformat(),
+    }
+
+
+def _norm(dt):
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def baseline_overlaps(events):
+    """The original O(n^2) overlap scan, emitting conflict dicts"""
+    conflicts = []
+    ordered = sorted(events, key=lambda e: e.start_time)
+    for i in range(len(ordered)):
+        for j in range(i + 1, len(ordered)):
+            e1, e2 = ordered[i], ordered[j]
+            s1, t1 = _norm(e1.start_time), _norm(e1.end_time)
+            s2, t2 = _norm(e2.start_time), _norm(e2.end_time)
+            if t1 > s2 and s1 < t2:
+                minutes = (min(t1, t2) - max(s1, s2)).total_seconds() / 60
+                severity = "high" if minutes >= 30 else "medium" if minutes >= 15 else "low"
+                conflicts.append({
+                    "conflict_type": "overlap",
+                    "severity": severity,
+                    "events": [_ref(e1), _ref(e2)],
+                    "description": f"'{e1.summary}' and '{e2.summary}' overlap by {int(minutes)} minutes",
+                    "suggestion": "Consider rescheduling one of these events or declining if not critical",
+                })
+    return conflicts
+
+
+def baseline_back_to_back(events, buffer_minutes=5):
+    """The original adjacent-pair buffer check, emitting conflict dicts"""
+    conflicts = []
+    ordered = sorted(events, key=lambda e: e.start_time)
+    for e1, e2 in zip(ordered, ordered[1:]):
+        s1, t1 = _norm(e1.start_time), _norm(e1.end_time)
+        s2, t2 = _norm(e2.start_time), _norm(e2.end_time)
+        gap_minutes = (s2 - t1).total_seconds() / 60
+        if 0 <= gap_minutes < buffer_minutes:
+            total = (t1 - s1).total_seconds() / 60 + (t2 - s2).total_seconds() / 60
+            severity = "high" if total >= 120 else "medium" if total >= 60 else "low"
+            conflicts.append({
+                "conflict_type": "back_to_back",
+                "severity": severity,
+                "events": [_ref(e1), _ref(e2)],
+                "description": f"Only {int(gap_minutes)} minute(s) between '{e1.summary}' and '{e2.summary}'",
+                "suggestion": "Consider adding a buffer for breaks, travel time, or preparation",
+            })
+    return conflicts
+
+
+def baseline_analysis(events):
+    """The original analyze_calendar result"""
+    overlaps = baseline_overlaps(events)
+    back_to_back = baseline_back_to_back(events)
+    conflicts = overlaps + back_to_back
+    high = sum(c["severity"] == "high" for c in conflicts)
+    medium = sum(c["severity"] == "medium" for c in conflicts)
+    return {
+        "total_events": len(events),
+        "total_conflicts": len(conflicts),
+        "overlapping_events": len(overlaps),
+        "back_to_back_meetings": len(back_to_back),
+        "high_severity_conflicts": high,
+        "medium_severity_conflicts": medium,
+        "low_severity_conflicts": sum(c["severity"] == "low" for c in conflicts),
+        "conflicts": conflicts,
+        "needs_attention": high > 0 or medium > 2,
+    }
+
+
+def make_event(i, start, minutes):
+    return CalendarEvent(
+        id=str(i),
+        summary=f"Event {i}",
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+    )
+
+
+def random_events(rng, count, tz=timezone.utc):
+    base = datetime(2026, 1, 7, 8, tzinfo=tz)
+    return [
+        make_event(
+            i,
+            base + timedelta(minutes=5 * rng.randint(0, 100), seconds=rng.choice([0, 30, 59])),
+            5 * rng.randint(0, 20),
+        )
+        for i in range(count)
+    ]
+
+
+def test_overlaps_match_pairwise_scan_in_order():
+    rng = random.Random(7)
+    for _ in range(200):
+        events = random_events(rng, rng.randint(0, 30))
+        result = [c.model_dump() for c in detect_overlapping_events(events)]
+        assert result == baseline_overlaps(events)
+
+
+def test_busy_day_keeps_pairwise_order():
+    rng = random.Random(1)
+    events = random_events(rng, 120)
+    expected = baseline_overlaps(events)
+    assert len(expected) > 100
+    assert [c.model_dump() for c in detect_overlapping_events(events)] == expected
+
+
+def _at(hour, minute=0, tz=timezone.utc):
+    return datetime(2026, 1, 7, hour, minute, tzinfo=tz)
+
+
+def test_analysis_overlapping_chain():
+    events = [
+        make_event(0, _at(9), 60),
+        make_event(1, _at(9, 30), 60),
+        make_event(2, _at(10, 15), 30),
+        make_event(3, _at(10, 45), 15),
+    ]
+    assert analyze_calendar(events) == baseline_analysis(events)
+
+
+def test_analysis_nested_events():
+    events = [
+        make_event(0, _at(8), 480),
+        make_event(1, _at(9), 30),
+        make_event(2, _at(9, 32), 20),
+        make_event(3, _at(13), 90),
+        make_event(4, _at(13, 10), 10),
+    ]
+    assert analyze_calendar(events) == baseline_analysis(events)
+
+
+def test_analysis_zero_length_events():
+    events = [
+        make_event(0, _at(9), 0),
+        make_event(1, _at(9), 30),
+        make_event(2, _at(9, 30), 0),
+        make_event(3, _at(9, 30), 30),
+        make_event(4, _at(9, 15), 0),
+    ]
+    assert analyze_calendar(events) == baseline_analysis(events)
+
+
+def test_analysis_naive_events():
+    events = [
+        make_event(0, datetime(2026, 1, 7, 9), 45),
+        make_event(1, datetime(2026, 1, 7, 9, 30), 60),
+        make_event(2, datetime(2026, 1, 7, 10, 33), 30),
+    ]
+    assert analyze_calendar(events) == baseline_analysis(events)
+
+
+def test_analysis_matches_baseline_on_random_calendars():
+    rng = random.Random(11)
+    zones = [timezone.utc, timezone(timedelta(hours=2)), timezone(timedelta(hours=-5)), None]
+    for _ in range(200):
+        tz = rng.choice(zones)
+        events = random_events(rng, rng.randint(0, 30))
+        if tz is None:
+            events = [
+                e.model_copy(update={
+                    "start_time": e.start_time.replace(tzinfo=None),
+                    "end_time": e.end_time.replace(tzinfo=None),
+                })
+                for e in events
+            ]
+        else:
+            # Same instants, expressed in another offset
+            events = [
+                e.model_copy(update={
+                    "start_time": e.start_time.astimezone(tz),
+                    "end_time": e.end_time.astimezone(tz),
+                })
+                for e in events
+            ]
+        assert analyze_calendar(events) == baseline_analysis(events)
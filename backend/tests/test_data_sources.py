@@ -0,0 +1,100 @@
+"""
+Tests for the CollectedData count helpers.
+"""
+from datetime import datetime, timezone
+
+from models.data_sources import (
+    CalendarEvent,
+    CollectedData,
+    EmailData,
+    GongData,
+    MiroData,
+    MondayData,
+    NewsArticle,
+    NotionData,
+    SlackData,
+    WeatherData,
+)
+
+NOW = datetime(2024, 3, 4, 9, 0, tzinfo=timezone.utc)
+
+
+def _article(i, feed):
+    return NewsArticle(title=f"{feed} {i}", url=f"https://example.com/{feed}/{i}", content="")
+
+
+def populated(weather=True):
+    """CollectedData with a different number of items in every list"""
+    return CollectedData(
+        emails=[
+            EmailData(id=f"m{i}", thread_id=f"t{i}", subject="s", from_email="a@b.c", date=NOW, body="")
+            for i in range(2)
+        ],
+        calendar_events=[
+            CalendarEvent(id=f"e{i}", summary="e", start_time=NOW, end_time=NOW)
+            for i in range(3)
+        ],
+        slack_messages=[
+            SlackData(channel_id="C1", channel_name="general", message_id=str(i), user_id="U1", text="", timestamp=NOW)
+            for i in range(4)
+        ],
+        gong_calls=[
+            GongData(call_id=f"g{i}", title="c", date=NOW, duration_minutes=30)
+            for i in range(5)
+        ],
+        monday_items=[
+            MondayData(item_id=f"i{i}", board_id="b", board_name="b", item_name="i", created_at=NOW, updated_at=NOW)
+            for i in range(6)
+        ],
+        notion_pages=[
+            NotionData(page_id=f"p{i}", title="p", created_time=NOW, last_edited_time=NOW)
+            for i in range(7)
+        ],
+        miro_boards=[
+            MiroData(board_id=f"b{i}", board_name="b", created_at=NOW, modified_at=NOW)
+            for i in range(8)
+        ],
+        weather=WeatherData(
+            location={"name": "Boston"},
+            current_temperature=50.0,
+            feels_like=48.0,
+            humidity=60,
+            description="clear",
+            wind_speed=5.0,
+            visibility=10.0,
+        ) if weather else None,
+        news_articles=[_article(i, "news") for i in range(9)],
+        ai_news_articles=[_article(i, "ai") for i in range(10)],
+        competitor_news_articles=[_article(i, "competitor") for i in range(11)],
+    )
+
+
+def baseline_total(data):
+    """The original get_total_items, summing every field directly"""
+    return (
+        len(data.emails)
+        + len(data.calendar_events)
+        + len(data.slack_messages)
+        + len(data.gong_calls)
+        + len(data.monday_items)
+        + len(data.notion_pages)
+        + len(data.miro_boards)
+        + (1 if data.weather else 0)
+        + len(data.news_articles)
+        + len(data.ai_news_articles)
+        + len(data.competitor_news_articles)
+    )
+
+
+def test_total_items_matches_baseline():
+    data = populated()
+    assert data.get_total_items() == baseline_total(data) == 66
+
+
+def test_total_items_without_weather():
+    data = populated(weather=False)
+    assert data.get_total_items() == baseline_total(data) == 65
+
+
+def test_total_items_empty():
+    assert CollectedData().get_total_items() == 0
@@ -1,17 +1,33 @@
 """
 Calendar analysis utilities for detecting conflicts and issues.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+import heapq
+from operator import itemgetter
 from datetime import datetime, timedelta, timezone
 from models.data_sources import CalendarEvent
 from pydantic import BaseModel, Field
 
+_UTC = timezone.utc
+
+# The sweep works on integer microseconds since the epoch
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_MINUTE = 60_000_000
+
+# Overlap length at which an overlap becomes medium / high severity
+_OVERLAP_MEDIUM = 15 * _US_PER_MINUTE
+_OVERLAP_HIGH = 30 * _US_PER_MINUTE
+
+# Combined length of two back-to-back meetings for medium / high severity
+_BACK_TO_BACK_MEDIUM = 60 * _US_PER_MINUTE
+_BACK_TO_BACK_HIGH = 120 * _US_PER_MINUTE
+
 
 def normalize_datetime(dt: datetime) -> datetime:
     """Ensure datetime is timezone-aware (UTC if naive)"""
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=_UTC)
 
 
 class CalendarConflict(BaseModel):
@@ -23,6 +39,141 @@ class CalendarConflict(BaseModel):
     suggestion: Optional[str] = Field(None, description="Suggested resolution")
 
 
+def _epoch_us(dt: datetime) -> int:
+    """Microseconds since the epoch, treating naive datetimes as UTC"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _event_ref(event: CalendarEvent) -> Dict[str, Any]:
+    """Summary of an event as embedded in a conflict"""
+    return {
+        "id": event.id,
+        "summary": event.summary,
+        "start_time": event.start_time.isoformat(),
+        "end_time": event.end_time.isoformat()
+    }
+
+
+def _analyze_sweep(
+    events: List[CalendarEvent],
+    buffer_minutes: int = 5,
+    severity_counts: Optional[Counter] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Find overlapping and back-to-back events in a single pass.
+
+    Each event is converted once to integer epoch microseconds, so the sweep
+    compares plain ints rather than timezone-aware datetimes, and the list is
+    sorted once. Overlaps come from a sweep line: a min-heap holds the events
+    still running, so only pairs that actually overlap are ever compared.
+    They are returned ordered by (earlier event, later event) in start order,
+    as a pairwise scan would list them. Back-to-back meetings are adjacent
+    entries of the same sorted list. Conflicts are built as plain dicts in
+    the CalendarConflict shape, skipping per-conflict validation.
+
+    Args:
+        events: List of calendar events
+        buffer_minutes: Minimum buffer time required between meetings
+        severity_counts: Optional Counter incremented with each conflict's severity
+
+    Returns:
+        Tuple of (overlap conflicts, back-to-back conflicts) as dicts
+    """
+    if severity_counts is None:
+        severity_counts = Counter()
+
+    # (earlier index, later index, conflict), sorted into pair order at the end
+    keyed_overlaps: List[Tuple[int, int, Dict[str, Any]]] = []
+    back_to_back: List[Dict[str, Any]] = []
+
+    # Convert each event once, then sort by start time
+    norm: List[Tuple[int, int, CalendarEvent]] = sorted(
+        ((_epoch_us(e.start_time), _epoch_us(e.end_time), e) for e in events),
+        key=lambda n: n[0]
+    )
+
+    # Conflict summary of each event, in sorted order. Built on the event's
+    # first conflict only, then shared by all of its later conflicts
+    refs: List[Optional[Dict[str, Any]]] = [None] * len(norm)
+
+    def ref(i: int) -> Dict[str, Any]:
+        summary = refs[i]
+        if summary is None:
+            summary = refs[i] = _event_ref(norm[i][2])
+        return summary
+
+    buffer = buffer_minutes * _US_PER_MINUTE
+
+    # (end, index, start, event) of events that have not finished yet
+    active: List[Tuple[int, int, int, CalendarEvent]] = []
+
+    for idx, (e2_start, e2_end, event2) in enumerate(norm):
+        # Drop events that ended before this one starts
+        while active and active[0][0] <= e2_start:
+            heapq.heappop(active)
+
+        for e1_end, e1_idx, e1_start, event1 in active:
+            if e1_start >= e2_end:
+                continue
+
+            overlap = min(e1_end, e2_end) - e2_start
+
+            # Determine severity
+            if overlap >= _OVERLAP_HIGH:
+                severity = "high"
+            elif overlap >= _OVERLAP_MEDIUM:
+                severity = "medium"
+            else:
+                severity = "low"
+
+            severity_counts[severity] += 1
+            keyed_overlaps.append((e1_idx, idx, {
+                "conflict_type": "overlap",
+                "severity": severity,
+                "events": [ref(e1_idx), ref(idx)],
+                "description": f"'{event1.summary}' and '{event2.summary}' overlap by {overlap // _US_PER_MINUTE} minutes",
+                "suggestion": "Consider rescheduling one of these events or declining if not critical"
+            }))
+
+        heapq.heappush(active, (e2_end, idx, e2_start, event2))
+
+        if idx == 0:
+            continue
+
+        # Compare with the previous event for a missing buffer
+        e1_start, e1_end, event1 = norm[idx - 1]
+        gap = e2_start - e1_end
+
+        if 0 <= gap < buffer:
+            # Determine severity based on meeting duration
+            total_duration = (e1_end - e1_start) + (e2_end - e2_start)
+
+            if total_duration >= _BACK_TO_BACK_HIGH:
+                severity = "high"
+            elif total_duration >= _BACK_TO_BACK_MEDIUM:
+                severity = "medium"
+            else:
+                severity = "low"
+
+            severity_counts[severity] += 1
+            back_to_back.append({
+                "conflict_type": "back_to_back",
+                "severity": severity,
+                "events": [ref(idx - 1), ref(idx)],
+                "description": f"Only {gap // _US_PER_MINUTE} minute(s) between '{event1.summary}' and '{event2.summary}'",
+                "suggestion": "Consider adding a buffer for breaks, travel time, or preparation"
+            })
+
+    # The heap yields each event's overlaps grouped by the later event;
+    # callers show conflicts in list order, so restore pairwise order
+    keyed_overlaps.sort(key=itemgetter(0, 1))
+    overlaps = [conflict for _, _, conflict in keyed_overlaps]
+
+    return overlaps, back_to_back
+
+
 def detect_overlapping_events(events: List[CalendarEvent]) -> List[CalendarConflict]:
     """
     Detect events with time overlaps.
@@ -33,58 +184,7 @@ def detect_overlapping_events(events: List[CalendarEvent]) -> List[CalendarConfl
     Returns:
         List of conflicts for overlapping events
     """
-    conflicts = []
-
-    # Sort events by start time
-    sorted_events = sorted(events, key=lambda e: e.start_time)
-
-    for i in range(len(sorted_events)):
-        for j in range(i + 1, len(sorted_events)):
-            event1 = sorted_events[i]
-            event2 = sorted_events[j]
-
-            # Normalize datetimes to handle timezone-aware/naive comparison
-            e1_start = normalize_datetime(event1.start_time)
-            e1_end = normalize_datetime(event1.end_time)
-            e2_start = normalize_datetime(event2.start_time)
-            e2_end = normalize_datetime(event2.end_time)
-
-            # Check if events overlap
-            if e1_end > e2_start and e1_start < e2_end:
-                overlap_start = max(e1_start, e2_start)
-                overlap_end = min(e1_end, e2_end)
-                overlap_minutes = (overlap_end - overlap_start).total_seconds() / 60
-
-                # Determine severity
-                if overlap_minutes >= 30:
-                    severity = "high"
-                elif overlap_minutes >= 15:
-                    severity = "medium"
-                else:
-                    severity = "low"
-
-                conflicts.append(CalendarConflict(
-                    conflict_type="overlap",
-                    severity=severity,
-                    events=[
-                        {
-                            "id": event1.id,
-                            "summary": event1.summary,
-                            "start_time": event1.start_time.isoformat(),
-                            "end_time": event1.end_time.isoformat()
-                        },
-                        {
-                            "id": event2.id,
-                            "summary": event2.summary,
-                            "start_time": event2.start_time.isoformat(),
-                            "end_time": event2.end_time.isoformat()
-                        }
-                    ],
-                    description=f"'{event1.summary}' and '{event2.summary}' overlap by {int(overlap_minutes)} minutes",
-                    suggestion="Consider rescheduling one of these events or declining if not critical"
-                ))
-
-    return conflicts
+    return [CalendarConflict.model_construct(**c) for c in _analyze_sweep(events)[0]]
 
 
 def find_back_to_back_meetings(
@@ -101,60 +201,10 @@ def find_back_to_back_meetings(
     Returns:
         List of conflicts for back-to-back meetings
     """
-    conflicts = []
-
-    # Sort events by start time
-    sorted_events = sorted(events, key=lambda e: e.start_time)
-
-    for i in range(len(sorted_events) - 1):
-        event1 = sorted_events[i]
-        event2 = sorted_events[i + 1]
-
-        # Normalize datetimes
-        e1_start = normalize_datetime(event1.start_time)
-        e1_end = normalize_datetime(event1.end_time)
-        e2_start = normalize_datetime(event2.start_time)
-        e2_end = normalize_datetime(event2.end_time)
-
-        # Calculate gap between meetings
-        gap = e2_start - e1_end
-        gap_minutes = gap.total_seconds() / 60
-
-        # Check if gap is less than required buffer
-        if 0 <= gap_minutes < buffer_minutes:
-            # Determine severity based on meeting duration
-            total_duration = (e1_end - e1_start).total_seconds() / 60
-            total_duration += (e2_end - e2_start).total_seconds() / 60
-
-            if total_duration >= 120:  # 2+ hours of back-to-back meetings
-                severity = "high"
-            elif total_duration >= 60:  # 1+ hours
-                severity = "medium"
-            else:
-                severity = "low"
-
-            conflicts.append(CalendarConflict(
-                conflict_type="back_to_back",
-                severity=severity,
-                events=[
-                    {
-                        "id": event1.id,
-                        "summary": event1.summary,
-                        "start_time": event1.start_time.isoformat(),
-                        "end_time": event1.end_time.isoformat()
-                    },
-                    {
-                        "id": event2.id,
-                        "summary": event2.summary,
-                        "start_time": event2.start_time.isoformat(),
-                        "end_time": event2.end_time.isoformat()
-                    }
-                ],
-                description=f"Only {int(gap_minutes)} minute(s) between '{event1.summary}' and '{event2.summary}'",
-                suggestion="Consider adding a buffer for breaks, travel time, or preparation"
-            ))
-
-    return conflicts
+    return [
+        CalendarConflict.model_construct(**c)
+        for c in _analyze_sweep(events, buffer_minutes)[1]
+    ]
 
 
 def analyze_calendar(events: List[CalendarEvent]) -> Dict[str, Any]:
@@ -167,24 +217,19 @@ def analyze_calendar(events: List[CalendarEvent]) -> Dict[str, Any]:
     Returns:
         Dictionary with analysis results including all conflicts
     """
-    overlaps = detect_overlapping_events(events)
-    back_to_back = find_back_to_back_meetings(events)
+    severity_counts: Counter = Counter()
+    overlaps, back_to_back = _analyze_sweep(events, severity_counts=severity_counts)
 
     all_conflicts = overlaps + back_to_back
 
-    # Calculate statistics
-    high_severity = [c for c in all_conflicts if c.severity == "high"]
-    medium_severity = [c for c in all_conflicts if c.severity == "medium"]
-    low_severity = [c for c in all_conflicts if c.severity == "low"]
-
     return {
         "total_events": len(events),
         "total_conflicts": len(all_conflicts),
         "overlapping_events": len(overlaps),
         "back_to_back_meetings": len(back_to_back),
-        "high_severity_conflicts": len(high_severity),
-        "medium_severity_conflicts": len(medium_severity),
-        "low_severity_conflicts": len(low_severity),
-        "conflicts": [c.model_dump() for c in all_conflicts],
-        "needs_attention": len(high_severity) > 0 or len(medium_severity) > 2
+        "high_severity_conflicts": severity_counts["high"],
+        "medium_severity_conflicts": severity_counts["medium"],
+        "low_severity_conflicts": severity_counts["low"],
+        "conflicts": all_conflicts,
+        "needs_attention": severity_counts["high"] > 0 or severity_counts["medium"] > 2
     }
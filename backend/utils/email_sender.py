@@ -1,122 +1,44 @@
 """Email sender utility for daily briefings"""
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from email import policy
+from email.message import EmailMessage
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import logging
 import os
+import re
 from dotenv import load_dotenv
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
+# Inline markdown patterns used by markdown_to_html, compiled once at import
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_LINK_RE = re.compile(r'\[(.*?)\]\((.*?)\)')
 
-def send_briefing_email(
-    briefing_markdown: str,
-    recipient_email: str,
-    subject: str = "Your Daily Briefing",
-    sender_email: Optional[str] = None,
-    sender_password: Optional[str] = None
-) -> bool:
-    """
-    Send briefing as HTML email using Gmail SMTP
-
-    Args:
-        briefing_markdown: The markdown briefing content
-        recipient_email: Email address to send to
-        subject: Email subject line
-        sender_email: Gmail address (defaults to env var)
-        sender_password: Gmail app password (defaults to env var)
-
-    Returns:
-        True if sent successfully, False otherwise
-    """
-    sender_email = sender_email or os.getenv("SENDER_EMAIL")
-    sender_password = sender_password or os.getenv("SENDER_APP_PASSWORD")
-
-    if not sender_email or not sender_password:
-        raise ValueError("SENDER_EMAIL and SENDER_APP_PASSWORD must be set in .env")
-
-    try:
-        # Convert markdown to HTML (basic conversion)
-        html_content = markdown_to_html(briefing_markdown)
-
-        # Create message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = sender_email
-        message["To"] = recipient_email
-
-        # Add plain text version (fallback)
-        text_part = MIMEText(briefing_markdown, "plain")
-        message.attach(text_part)
-
-        # Add HTML version
-        html_part = MIMEText(html_content, "html")
-        message.attach(html_part)
-
-        # Send via Gmail SMTP
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(sender_email, sender_password)
-            server.send_message(message)
-
-        print(f"✅ Email sent successfully to {recipient_email}")
-        return True
+_H2_OPEN = '<h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 5px;">'
 
-    except Exception as e:
-        print(f"❌ Failed to send email: {str(e)}")
-        return False
-
-
-def markdown_to_html(markdown: str) -> str:
-    """
-    Convert markdown to HTML for email
-
-    Uses basic markdown conversion. For production, consider using
-    a library like markdown2 or mistune.
-    """
-    html = markdown
+# Rendered briefings kept by markdown_to_html (each is a full HTML page)
+MARKDOWN_CACHE_SIZE = 8
 
-    # Basic conversions
-    import re
 
-    # Headers
-    html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.*?)$', r'<h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 5px;">\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-
-    # Bold
-    html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-
-    # Links
-    html = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2" style="color: #3498db;">\1</a>', html)
-
-    # Line breaks (markdown uses two spaces + newline or two newlines)
-    html = html.replace('  \n', '<br>\n')
-    html = re.sub(r'\n\n+', '</p><p>', html)
-
-    # Lists
-    html = re.sub(r'^\- (.*?)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-    html = re.sub(r'(<li>.*?</li>)', r'<ul>\1</ul>', html, flags=re.DOTALL)
-
-    # Remove horizontal rules entirely
-    html = html.replace('---', '')
-
-    # Wrap in HTML template with compact styling and page numbers
-    html_template = f"""
+# Email page wrapped around the rendered briefing, with compact styling and
+# page numbers; the briefing HTML goes between prefix and suffix
+_HTML_PREFIX = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <style>
-            @media print {{
-                @page {{
+            @media print {
+                @page {
                     margin: 0.5in;
-                    @bottom-center {{
+                    @bottom-center {
                         content: "Page " counter(page) " of " counter(pages);
-                    }}
-                }}
-            }}
+                    }
+                }
+            }
 
-            body {{
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
                 line-height: 1.35;
                 color: #333;
@@ -125,72 +47,74 @@ def markdown_to_html(markdown: str) -> str:
                 padding: 15px;
                 background-color: #f5f5f5;
                 font-size: 13px;
-            }}
-            .container {{
+            }
+            .container {
                 background-color: white;
                 padding: 20px 25px;
                 border-radius: 8px;
                 box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            h1 {{
+            }
+            h1 {
                 color: #2c3e50;
                 border-bottom: 2px solid #3498db;
                 padding-bottom: 6px;
                 margin-bottom: 12px;
                 font-size: 22px;
-            }}
-            h2 {{
+            }
+            h2 {
                 color: #2c3e50;
                 margin-top: 15px;
                 margin-bottom: 6px;
                 font-size: 16px;
                 border-bottom: 1px solid #e0e0e0;
                 padding-bottom: 3px;
-            }}
-            h3 {{
+            }
+            h3 {
                 font-size: 14px;
                 margin-top: 10px;
                 margin-bottom: 4px;
-            }}
-            p {{
+            }
+            p {
                 margin: 6px 0;
-            }}
-            ul {{
+            }
+            ul {
                 margin: 6px 0;
                 padding-left: 20px;
-            }}
-            li {{
+            }
+            li {
                 margin: 3px 0;
                 line-height: 1.4;
-            }}
-            a {{
+            }
+            a {
                 color: #3498db;
                 text-decoration: none;
-            }}
-            a:hover {{
+            }
+            a:hover {
                 text-decoration: underline;
-            }}
-            .metadata {{
+            }
+            .metadata {
                 color: #7f8c8d;
                 font-size: 0.85em;
                 margin: 4px 0 8px 0;
-            }}
-            .page-footer {{
+            }
+            .page-footer {
                 text-align: center;
                 color: #7f8c8d;
                 font-size: 11px;
                 margin-top: 20px;
                 padding-top: 10px;
                 border-top: 1px solid #e0e0e0;
-            }}
-            strong {{
+            }
+            strong {
                 font-weight: 600;
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="container">
-            {html}
+            """
+
+_HTML_SUFFIX = """
             <div class="page-footer">
                 Daily Briefing | Generated with Port Assistant
             </div>
@@ -199,10 +123,327 @@ def markdown_to_html(markdown: str) -> str:
     </html>
     """
 
-    return html_template
+
+# Gmail SMTP over implicit TLS
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+
+
+@lru_cache(maxsize=1)
+def _smtp_creds() -> Tuple[Optional[str], Optional[str]]:
+    """Sender address and app password from the environment, loading .env on first use"""
+    load_dotenv()
+    return os.getenv("SENDER_EMAIL"), os.getenv("SENDER_APP_PASSWORD")
+
+
+def _render_briefing(briefing_markdown: str) -> Tuple[str, str]:
+    """(plain text, HTML) bodies of a briefing, rendered once before any sending"""
+    return briefing_markdown, markdown_to_html(briefing_markdown)
+
+
+def _resolve_creds(
+    sender_email: Optional[str],
+    sender_password: Optional[str]
+) -> Tuple[str, str]:
+    """Fill in missing SMTP credentials from the environment"""
+    if not sender_email or not sender_password:
+        env_email, env_password = _smtp_creds()
+        sender_email = sender_email or env_email
+        sender_password = sender_password or env_password
+
+    if not sender_email or not sender_password:
+        raise ValueError("SENDER_EMAIL and SENDER_APP_PASSWORD must be set in .env")
+
+    return sender_email, sender_password
+
+
+class BriefingMailer:
+    """
+    Sends briefing emails over one reusable Gmail SMTP session.
+
+    The connection is opened and authenticated on the first send, checked
+    with NOOP before each later send and reopened if the server dropped it.
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, sender_email: str, sender_password: str):
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self._server: Optional[smtplib.SMTP_SSL] = None
+
+    def __enter__(self) -> "BriefingMailer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _ensure_connected(self) -> smtplib.SMTP_SSL:
+        """Return a live, logged-in SMTP session, reconnecting if needed"""
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPException, OSError):
+                self._drop()
+
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+        try:
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        return server
+
+    def _drop(self) -> None:
+        """Forget the current session without waiting on the server"""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    def _build_message(self, text: str, html: str, subject: str) -> EmailMessage:
+        """Build the message from an already rendered briefing; the caller sets To"""
+        message = EmailMessage(policy=policy.SMTP)
+        message["Subject"] = subject
+        message["From"] = self.sender_email
+
+        # Plain text version (fallback), then the HTML alternative
+        message.set_content(text)
+        message.add_alternative(html, subtype="html")
+        return message
+
+    def _deliver(self, message: EmailMessage) -> None:
+        """Send a message over the session, reconnecting once if it was dropped"""
+        server = self._ensure_connected()
+        try:
+            server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The session died between NOOP and send; retry once on a new one
+            self._drop()
+            self._ensure_connected().send_message(message)
+
+    def send(
+        self,
+        briefing_markdown: str,
+        recipient_email: str,
+        subject: str = "Your Daily Briefing"
+    ) -> None:
+        """Send one briefing; raises on failure"""
+        message = self._build_message(*_render_briefing(briefing_markdown), subject)
+        message["To"] = recipient_email
+        self._deliver(message)
+
+    def send_bulk(
+        self,
+        briefing_markdown: str,
+        recipients: List[str],
+        subject: str = "Your Daily Briefing"
+    ) -> Dict[str, bool]:
+        """
+        Send the same briefing to each recipient individually.
+
+        The HTML is rendered and the message built once; only the To header
+        changes between sends, all over the same session.
+
+        Returns:
+            Mapping of recipient to whether their send succeeded
+        """
+        message = self._build_message(*_render_briefing(briefing_markdown), subject)
+        results: Dict[str, bool] = {}
+
+        for recipient in recipients:
+            del message["To"]
+            message["To"] = recipient
+            try:
+                self._deliver(message)
+                results[recipient] = True
+            except Exception as e:
+                logger.error("Failed to send email to %s: %s", recipient, e)
+                results[recipient] = False
+
+        return results
+
+    def close(self) -> None:
+        """Close the SMTP session if one is open"""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self._drop()
+
+
+def send_briefing_email(
+    briefing_markdown: str,
+    recipient_email: str,
+    subject: str = "Your Daily Briefing",
+    sender_email: Optional[str] = None,
+    sender_password: Optional[str] = None
+) -> bool:
+    """
+    Send briefing as HTML email using Gmail SMTP
+
+    Opens a session for this one email; use BriefingMailer directly to send
+    several briefings over the same connection.
+
+    Args:
+        briefing_markdown: The markdown briefing content
+        recipient_email: Email address to send to
+        subject: Email subject line
+        sender_email: Gmail address (defaults to env var)
+        sender_password: Gmail app password (defaults to env var)
+
+    Returns:
+        True if sent successfully, False otherwise
+    """
+    sender_email, sender_password = _resolve_creds(sender_email, sender_password)
+
+    try:
+        with BriefingMailer(sender_email, sender_password) as mailer:
+            mailer.send(briefing_markdown, recipient_email, subject)
+
+        logger.info("Email sent successfully to %s", recipient_email)
+        return True
+
+    except Exception:
+        logger.exception("Failed to send email")
+        return False
+
+
+def send_briefing_emails(
+    briefing_markdown: str,
+    recipient_emails: List[str],
+    subject: str = "Your Daily Briefing",
+    sender_email: Optional[str] = None,
+    sender_password: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Send the same briefing to several recipients over one Gmail SMTP session
+
+    Args:
+        briefing_markdown: The markdown briefing content
+        recipient_emails: Email addresses to send to, one message each
+        subject: Email subject line
+        sender_email: Gmail address (defaults to env var)
+        sender_password: Gmail app password (defaults to env var)
+
+    Returns:
+        Mapping of recipient to whether their email was sent
+    """
+    sender_email, sender_password = _resolve_creds(sender_email, sender_password)
+
+    try:
+        with BriefingMailer(sender_email, sender_password) as mailer:
+            results = mailer.send_bulk(briefing_markdown, recipient_emails, subject)
+    except Exception:
+        logger.exception("Failed to send emails")
+        return {recipient: False for recipient in recipient_emails}
+
+    logger.info(
+        "Emails sent successfully to %s/%s recipients", sum(results.values()), len(results)
+    )
+    return results
+
+
+def _inline(text: str) -> str:
+    """Apply bold and link markup within a single line"""
+    # Most lines carry no markup; a substring check is far cheaper than a regex scan
+    if '**' in text:
+        text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
+    if '](' in text:
+        text = _LINK_RE.sub(r'<a href="\2" style="color: #3498db;">\1</a>', text)
+    return text
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def markdown_to_html(markdown: str) -> str:
+    """
+    Convert markdown to HTML for email
+
+    Uses basic markdown conversion. For production, consider using
+    a library like markdown2 or mistune. The conversion is pure, so recent
+    results are memoized by content.
+    """
+    parts: List[str] = []
+    in_list = False
+    in_para = False
+
+    lines = markdown.split('\n')
+    last = len(lines) - 1
+
+    # Bound once: these run for every line
+    emit = parts.append
+    inline = _inline
+
+    # Single pass over the lines: classify each one and emit its HTML
+    for i, line in enumerate(lines):
+        # Horizontal rules (trailing whitespace allowed) are dropped
+        # entirely, like a blank line
+        if line.startswith('---') and line.rstrip() == '---':
+            line = ''
+
+        # Only lines starting with "#" are probed for a heading prefix
+        first = line[:1]
+        if first == '#' and line.startswith('# '):
+            heading = f'<h1>{inline(line[2:])}</h1>'
+        elif first == '#' and line.startswith('## '):
+            heading = f'{_H2_OPEN}{inline(line[3:])}</h2>'
+        elif first == '#' and line.startswith('### '):
+            heading = f'<h3>{inline(line[4:])}</h3>'
+        else:
+            heading = None
+
+        is_item = heading is None and first == '-' and line.startswith('- ')
+        is_text = heading is None and not is_item and line != ''
+
+        # A paragraph is a run of text lines; a list a run of items
+        if in_para and not is_text:
+            emit('</p>')
+            in_para = False
+        if in_list and not is_item:
+            emit('</ul>')
+            in_list = False
+
+        if not line:
+            continue
+
+        # Lines stay newline-separated in the output
+        if parts:
+            emit('\n')
+
+        if heading is not None:
+            emit(heading)
+            continue
+
+        # Two trailing spaces mark a line break
+        if i != last and line.endswith('  '):
+            line = line[:-2] + '<br>'
+
+        if is_item:
+            if not in_list:
+                emit('<ul>')
+                in_list = True
+            emit(f'<li>{inline(line[2:])}</li>')
+        else:
+            if not in_para:
+                emit('<p>')
+                in_para = True
+            emit(inline(line))
+
+    if in_para:
+        emit('</p>')
+    if in_list:
+        emit('</ul>')
+
+    # Wrap in HTML template with compact styling and page numbers
+    return _HTML_PREFIX + ''.join(parts) + _HTML_SUFFIX
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test email sending
     test_markdown = """# Test Daily Briefing
 
@@ -226,5 +467,6 @@ This is a test email with **bold text** and a [link](https://example.com).
 - Item 3
 """
 
+    load_dotenv()
     recipient = os.getenv("RECIPIENT_EMAIL", "your-email@example.com")
     send_briefing_email(test_markdown, recipient, subject="Test Daily Briefing")
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
-"""Test Slack connection and show current scopes"""
+"""Test Slack connection and show current scopes
+
+Pass --quick to stop after verifying the token with auth.test.
+"""
 import os
+import sys
 import httpx
 from dotenv import load_dotenv
 
 # Load environment variables
-load_dotenv(".env") if os.path.exists(".env") else load_dotenv("backend/.env")
+load_dotenv(next((path for path in (".env", "backend/.env") if os.path.exists(path)), None))
 
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+QUICK = "--quick" in sys.argv
 
 if not SLACK_BOT_TOKEN:
     print("❌ SLACK_BOT_TOKEN not found in backend/.env")
@@ -16,12 +21,15 @@ if not SLACK_BOT_TOKEN:
 print("Testing Slack Bot Token...")
 print("=" * 70)
 
-with httpx.Client() as client:
+# One HTTP/2 connection, kept alive across both calls, carries the token header
+with httpx.Client(
+    http2=True,
+    timeout=10.0,
+    headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"},
+    limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=30),
+) as client:
     # Test auth
-    response = client.get(
-        "https://slack.com/api/auth.test",
-        headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
-    )
+    response = client.get("https://slack.com/api/auth.test")
 
     data = response.json()
 
@@ -35,12 +43,19 @@ with httpx.Client() as client:
     print(f"   Bot ID: {data.get('user_id')}")
     print()
 
-    # Try to list conversations to see what scopes are missing
+    if QUICK:
+        sys.exit(0)
+
+    # Try to list conversations to see what scopes are missing; one result
+    # is enough to prove the scopes are granted
     print("Testing conversations.list...")
     response = client.get(
         "https://slack.com/api/conversations.list",
-        headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"},
-        params={"types": "public_channel,private_channel,im"}
+        params={
+            "types": "public_channel,private_channel,im",
+            "limit": 1,
+            "exclude_archived": True,
+        }
     )
 
     data = response.json()
@@ -74,7 +89,6 @@ with httpx.Client() as client:
         print(f"Response needed: {data.get('needed')}")
         print(f"Response provided: {data.get('provided')}")
     else:
-        channels = data.get("channels", [])
-        print(f"✅ Successfully listed {len(channels)} conversations")
+        print("✅ Successfully listed conversations")
         print()
         print("Your Slack integration is working correctly!")